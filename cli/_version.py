@@ -0,0 +1,36 @@
+"""``--version`` handling shared by the ``turf`` and ``cli.turf_cli`` entry points.
+
+Stdlib-only, so both can answer before Typer (or any ``turf`` module) is imported.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Sequence
+
+VERSION_FLAGS = ("--version", "-V")
+_PYPROJECT = Path(__file__).resolve().parent.parent / "pyproject.toml"
+
+
+def package_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("turf-registry-resolver")
+    except PackageNotFoundError:
+        pass
+    # Uninstalled source checkout: report what pyproject.toml declares.
+    try:
+        match = re.search(r'^version\s*=\s*"([^"]+)"', _PYPROJECT.read_text(encoding="utf-8"), re.MULTILINE)
+    except OSError:
+        match = None
+    return match.group(1) if match else "unknown"
+
+
+def print_version_if_requested(argv: Sequence[str]) -> bool:
+    """Print ``turf <version>`` and return True when ``argv`` is exactly a version flag."""
+    if len(argv) == 2 and argv[1] in VERSION_FLAGS:
+        print(f"turf {package_version()}")
+        return True
+    return False
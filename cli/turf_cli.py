@@ -2,149 +2,133 @@ from __future__ import annotations
 
 """High-level automation CLI for demo runs, overlays, and site rendering."""
 
-import json
+import functools
 import pathlib
-from dataclasses import asdict
-from datetime import datetime
+import sys
+import time
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Callable
+
+from cli._version import print_version_if_requested
+
+# `python -m cli.turf_cli --version` answers before Typer is imported or any
+# command is registered.
+if __name__ == "__main__" and print_version_if_requested(sys.argv):
+    raise SystemExit(0)
 
 import typer
 
-from engine.turf_engine_pro import (
-    apply_pro_overlay_to_stake_card,
-    build_runner_vector,
-    overlay_from_stake_card,
-    pro_overlay_logit_win_place_v0,
-)
-from turf.backfill_digests import BackfillConfig, backfill_digests as run_backfill_digests
-from turf.feature_flags import resolve_feature_flags
-from turf.race_summary import summarize_race
-from turf.value import derive_runner_value_fields
-from turf.compile_lite import RunnerInput, compile_stake_card, merge_odds_into_market
-from turf.parse_odds import parse_generic_odds_table, parsed_odds_to_market
-from turf.parse_ra import parsed_race_to_market_snapshot, parsed_race_to_speed_sidecar, parse_meeting_html
-from turf.digest import build_strategy_digest, write_strategy_digest
-from turf.simulation import Bet, select_bets_from_stake_card, simulate_bankroll
+# Engine/turf modules are imported inside the commands that use them so that
+# `--help` and unrelated commands do not pay for parsing/overlay imports.
+
+# Shared option defaults (Paths are immutable, so one instance serves every command).
+_DEFAULT_CARDS_DIR = Path("out/cards")
+_DEFAULT_DERIVED_DIR = Path("out/derived")
 
 app = typer.Typer(help="End-to-end TURF demo runner with overlays and site hooks")
 view_app = typer.Typer(help="Read-only stake-card viewers")
 app.add_typer(view_app, name="view")
 
 
-def _load_demo_artifacts(date: str) -> tuple[dict, dict, dict]:
-    meeting_html = Path("data/demo_meeting.html")
-    odds_html = Path("data/demo_odds.html")
-    meeting_id = f"DEMO_{date}"
-    race_number = 1
-
-    parsed = parse_meeting_html(meeting_html.read_text(), meeting_id=meeting_id, race_number=race_number, captured_at=f"{date}T10:00:00+11:00")
-    market = parsed_race_to_market_snapshot(parsed)
-    speed = parsed_race_to_speed_sidecar(parsed)
-
-    odds_rows = parse_generic_odds_table(odds_html.read_text())
-    odds = parsed_odds_to_market(odds_rows, meeting_id, race_number, f"{date}T10:01:00+11:00")
-    return market, speed, odds
-
-
-def _join_runner_inputs(market: dict, speed: dict) -> list[RunnerInput]:
-    joined = []
-    speed_map = {r.get("runner_number"): r for r in speed.get("runners", [])}
-    for runner in market.get("runners", []):
-        sidecar = speed_map.get(runner.get("runner_number"), {})
-        joined.append(
-            RunnerInput(
-                runner_number=runner.get("runner_number"),
-                runner_name=runner.get("runner_name"),
-                barrier=runner.get("barrier"),
-                price_now_dec=(runner.get("odds_minimal") or {}).get("price_now_dec"),
-                map_role_inferred=sidecar.get("map_role_inferred"),
-                avg_speed_mps=sidecar.get("avg_speed_mps"),
-            )
-        )
-    return joined
-
-
-def _build_engine_inputs(market: dict, speed: dict, lite_scores: dict) -> dict:
-    speed_map = {r.get("runner_number"): r for r in speed.get("runners", [])}
-    runners = []
-    for runner in market.get("runners", []):
-        rn = runner.get("runner_number")
-        odds_block = runner.get("odds_minimal") or {}
-        sidecar = speed_map.get(rn, {})
-        runners.append(
-            {
-                "runner_number": rn,
-                "lite_score": lite_scores.get(rn, 0.5),
-                "price_now_dec": odds_block.get("price_now_dec"),
-                "barrier": runner.get("barrier"),
-                "map_role_inferred": sidecar.get("map_role_inferred"),
-                "avg_speed_mps": sidecar.get("avg_speed_mps"),
-            }
-        )
-    return {
-        "distance_m": market.get("race", {}).get("distance_m"),
-        "track_condition_raw": market.get("race", {}).get("track_condition_raw") or market.get("meeting", {}).get("track_condition_raw"),
-        "field_size": len(runners),
-        "runners": runners,
-    }
-
-
-def _runner_value_fields(runner: dict) -> dict:
-    derived = derive_runner_value_fields(runner)
-    forecast = runner.get("forecast") or {}
-    odds = (runner.get("odds_minimal") or {}).get("price_now_dec")
-    return {
-        **derived,
-        "price": odds,
-        "value_edge": forecast.get("value_edge"),
-        "win_prob": forecast.get("win_prob"),
-        "runner_number": runner.get("runner_number"),
-        "runner_name": runner.get("runner_name", ""),
-        "lite_score": runner.get("lite_score", 0.0),
-        "lite_tag": runner.get("lite_tag", "PASS_LITE"),
-    }
+def _runner_value_fields(runner: dict, derive_runner_value_fields: Callable[[dict], dict]) -> dict:
+    # Callers import turf.value once per command and pass the deriver in: a function-level
+    # import here would cost ~1 µs per runner. It returns a fresh dict, so extend it in place.
+    fields = derive_runner_value_fields(runner)
+    forecast = runner.get("forecast")
+    odds_block = runner.get("odds_minimal")
+    fields["price"] = odds_block.get("price_now_dec") if odds_block else None
+    fields["value_edge"] = forecast.get("value_edge") if forecast else None
+    fields["win_prob"] = forecast.get("win_prob") if forecast else None
+    fields["runner_number"] = runner.get("runner_number")
+    fields["runner_name"] = runner.get("runner_name", "")
+    fields["lite_score"] = runner.get("lite_score", 0.0)
+    fields["lite_tag"] = runner.get("lite_tag", "PASS_LITE")
+    # Display order key (lite desc, runner number asc) for itemgetter-based sorts.
+    fields["_sort_key"] = (-fields["lite_score"], fields["runner_number"] or 0)
+    return fields
+
+
+_VALUE_FILTER_KEYS = (
+    "runner_number",
+    "runner_name",
+    "price",
+    "ev",
+    "ev_band",
+    "ev_marker",
+    "value_edge",
+    "risk_profile",
+)
+
+
+def _passes_value_filter(runner: dict, min_ev: float, max_price: float) -> bool:
+    # Prune on the raw fields (what derivation reports as ev/price) before deriving.
+    forecast = runner.get("forecast")
+    ev_val = forecast.get("ev_1u") if forecast else None
+    if ev_val is None or ev_val < min_ev:
+        return False
+    odds_block = runner.get("odds_minimal")
+    price = odds_block.get("price_now_dec") if odds_block else None
+    return not (isinstance(price, (int, float)) and price > max_price)
+
+
+_MOBILE_FMT = "{ev_marker} #{runner_number}: {runner_name} @ {price} | edge {edge}".format
+_PRETTY_FMT = "#{runner_number} {runner_name} | price {price} | edge {edge} | ev {ev} | band {ev_band} | risk {risk}".format
+
+
+def _fmt_num(value: object, spec: str) -> str:
+    if type(value) is float or isinstance(value, int):
+        return format(value, spec)
+    return "—"
 
 
 def _format_runner_mobile(runner: dict) -> str:
-    ev_marker = runner.get("ev_marker") or "·"
-    price = runner.get("price")
-    price_text = f"@ {price:.2f}" if isinstance(price, (int, float)) else "@ —"
-    edge = runner.get("value_edge")
-    edge_text = f"{edge:+.1%}" if isinstance(edge, (int, float)) else "—"
-    return f"{ev_marker} #{runner.get('runner_number')}: {runner.get('runner_name','')} {price_text} | edge {edge_text}"
+    return _MOBILE_FMT(
+        ev_marker=runner.get("ev_marker") or "·",
+        runner_number=runner.get("runner_number"),
+        runner_name=runner.get("runner_name", ""),
+        price=_fmt_num(runner.get("price"), ".2f"),
+        edge=_fmt_num(runner.get("value_edge"), "+.1%"),
+    )
 
 
 def _format_runner_pretty(runner: dict) -> str:
-    ev_band = runner.get("ev_band") or "?"
-    risk = runner.get("risk_profile") or "?"
-    price = runner.get("price")
-    price_text = f"{price:.2f}" if isinstance(price, (int, float)) else "—"
-    edge = runner.get("value_edge")
-    edge_text = f"{edge:+.2%}" if isinstance(edge, (int, float)) else "—"
-    ev_val = runner.get("ev")
-    ev_text = f"{ev_val:+.2f}" if isinstance(ev_val, (int, float)) else "—"
-    return (
-        f"#{runner.get('runner_number')} {runner.get('runner_name','')} | price {price_text} | "
-        f"edge {edge_text} | ev {ev_text} | band {ev_band} | risk {risk}"
+    return _PRETTY_FMT(
+        runner_number=runner.get("runner_number"),
+        runner_name=runner.get("runner_name", ""),
+        price=_fmt_num(runner.get("price"), ".2f"),
+        edge=_fmt_num(runner.get("value_edge"), "+.2%"),
+        ev=_fmt_num(runner.get("ev"), "+.2f"),
+        ev_band=runner.get("ev_band") or "?",
+        risk=runner.get("risk_profile") or "?",
     )
 
 
 @app.command()
 def demo_run(
-    out: pathlib.Path = typer.Option(Path("out/cards"), "--out", help="Directory for generated stake cards"),
-    date: Optional[str] = typer.Option(None, help="Date stamp for demo meeting (YYYY-MM-DD)"),
+    out: pathlib.Path = typer.Option(_DEFAULT_CARDS_DIR, "--out", help="Directory for generated stake cards"),
+    date: str | None = typer.Option(None, help="Date stamp for demo meeting (YYYY-MM-DD)"),
     enable_value_fields: bool = typer.Option(False, help="Enable PRO value/race summary derived fields (Plan 020)"),
     enable_race_summary: bool = typer.Option(False, help="Enable race summary block in PRO output"),
+    compact: bool = typer.Option(
+        False, "--compact/--no-compact", help="Write runner_vector.json without indentation (machine-read artifact)"
+    ),
 ):
     """Run the full Lite + PRO overlay pipeline using bundled demo fixtures."""
 
+    from engine.turf_engine_pro import apply_pro_overlay_to_stake_card, build_runner_vector, pro_overlay_logit_win_place_v0
+    from turf.compile_lite import compile_stake_card, merge_odds_into_market
+    from turf.demo_pipeline import load_demo_artifacts
+    from turf.feature_flags import resolve_feature_flags
+    from turf.jsonio import write_json_atomic
+    from turf.runner_join import build_engine_inputs, prepare_runner_tables
+
     out.mkdir(parents=True, exist_ok=True)
-    run_date = date or datetime.utcnow().date().isoformat()
-    market, speed, odds = _load_demo_artifacts(run_date)
+    run_date = date or time.strftime("%Y-%m-%d", time.gmtime())
+    market, speed, odds = load_demo_artifacts(run_date)
     merged_market = merge_odds_into_market(market, odds)
 
-    runner_rows = _join_runner_inputs(merged_market, speed)
+    runner_rows, engine_runners, price_map = prepare_runner_tables(merged_market, speed)
     stake_card, runner_outputs = compile_stake_card(
         meeting=merged_market.get("meeting", {}),
         race=merged_market.get("race", {}),
@@ -154,14 +138,14 @@ def demo_run(
     )
     lite_scores = {o.runner_number: o.lite_score for o in runner_outputs}
 
-    engine_inputs = _build_engine_inputs(merged_market, speed, lite_scores)
+    engine_inputs = build_engine_inputs(merged_market, engine_runners, lite_scores)
     runner_vector_payload = build_runner_vector(engine_inputs)
-    price_map = {row.get("runner_number"): (row.get("odds_minimal") or {}).get("price_now_dec") for row in merged_market.get("runners", [])}
+    engine_context = stake_card.get("engine_context") or {}
     forecasts = pro_overlay_logit_win_place_v0(
         runner_vector_payload.get("runners", []),
         price_map,
-        stake_card.get("engine_context", {}).get("degrade_mode", "NORMAL"),
-        stake_card.get("engine_context", {}).get("warnings", []),
+        engine_context.get("degrade_mode", "NORMAL"),
+        engine_context.get("warnings") or [],
     )
     feature_flags = resolve_feature_flags(
         {
@@ -179,9 +163,10 @@ def demo_run(
     lite_path = out / "stake_card.json"
     pro_path = out / "stake_card_pro.json"
     rv_path = out / "runner_vector.json"
-    lite_path.write_text(json.dumps(stake_card, indent=2))
-    pro_path.write_text(json.dumps(stake_card_pro, indent=2))
-    rv_path.write_text(json.dumps(runner_vector_payload, indent=2))
+    write_json_atomic(lite_path, stake_card)
+    write_json_atomic(pro_path, stake_card_pro)
+    # Stake cards stay indented for people; the runner vector is only read back by tools.
+    write_json_atomic(rv_path, runner_vector_payload, indent=None if compact else 2)
     typer.echo(f"Wrote {lite_path} and {pro_path}")
 
 
@@ -189,30 +174,35 @@ def demo_run(
 def apply_overlay(
     stake_card_path: pathlib.Path = typer.Option(..., exists=True, help="Path to stake_card JSON"),
     out: pathlib.Path = typer.Option(..., help="Where to write overlay-updated stake_card"),
-    runner_vector_path: Optional[pathlib.Path] = typer.Option(None, help="Optional precomputed runner_vector JSON"),
+    runner_vector_path: pathlib.Path | None = typer.Option(None, help="Optional precomputed runner_vector JSON"),
     enable_value_fields: bool = typer.Option(False, help="Enable PRO value/race summary derived fields (Plan 020)"),
     enable_race_summary: bool = typer.Option(False, help="Enable race summary block in PRO output"),
 ):
     """Apply the deterministic PRO overlay to an existing stake card."""
 
-    stake_card = json.loads(stake_card_path.read_text())
+    from engine.turf_engine_pro import (
+        apply_pro_overlay_to_stake_card,
+        overlay_from_stake_card,
+        pro_overlay_logit_win_place_v0,
+        stake_card_prices,
+    )
+    from turf.feature_flags import resolve_feature_flags
+    from turf.jsonio import load_json_cached, loads_json, write_json_atomic
+
+    stake_card = load_json_cached(stake_card_path)
     if runner_vector_path:
-        runner_vector_payload = json.loads(runner_vector_path.read_text())
+        runner_vector_payload = loads_json(runner_vector_path.read_bytes())
+        engine_context = stake_card.get("engine_context") or {}
+        forecasts = pro_overlay_logit_win_place_v0(
+            runner_vector_payload.get("runners", []),
+            stake_card_prices(stake_card),
+            engine_context.get("degrade_mode", "NORMAL"),
+            engine_context.get("warnings") or [],
+        )
     else:
-        runner_vector_payload, _ = overlay_from_stake_card(stake_card)
+        # Already forecasts from the stake card's own prices and engine_context.
+        runner_vector_payload, forecasts = overlay_from_stake_card(stake_card)
 
-    race = (stake_card.get("races") or [{}])[0]
-    prices = {}
-    for runner in race.get("runners", []):
-        odds_block = runner.get("odds_minimal") or {}
-        prices[runner.get("runner_number")] = odds_block.get("price_now_dec")
-
-    forecasts = pro_overlay_logit_win_place_v0(
-        runner_vector_payload.get("runners", []),
-        prices,
-        stake_card.get("engine_context", {}).get("degrade_mode", "NORMAL"),
-        stake_card.get("engine_context", {}).get("warnings", []),
-    )
     feature_flags = resolve_feature_flags(
         {
             "ev_bands": enable_value_fields or enable_race_summary,
@@ -226,27 +216,38 @@ def apply_overlay(
         feature_flags=feature_flags,
     )
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(json.dumps(updated, indent=2))
+    write_json_atomic(out, updated)
     typer.echo(f"Overlay applied and written to {out}")
 
 
+@functools.lru_cache(maxsize=1)
+def _load_site_builder():
+    # site/ cannot be a package (it would shadow the stdlib ``site`` module), so load
+    # build_site.py by path once per process instead of re-executing it per render.
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location("build_site", Path("site/build_site.py"))
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    # dataclasses resolve string annotations through sys.modules during exec.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)  # type: ignore[arg-type]
+    return module
+
+
 @app.command("render-site")
 def render_site(
-    stake_cards: pathlib.Path = typer.Option(Path("out/cards"), exists=True, help="Directory containing stake card JSON files"),
+    stake_cards: pathlib.Path = typer.Option(_DEFAULT_CARDS_DIR, exists=True, help="Directory containing stake card JSON files"),
     out: pathlib.Path = typer.Option(Path("public"), help="Output directory for static site"),
     derive_on_render: bool = typer.Option(
         False, help="Optionally derive EV/race summaries during rendering (default: off)"
     ),
+    workers: int = typer.Option(1, "--workers", min=1, help="Parse and render stake cards in N worker processes (output unchanged)"),
 ):
     """Render static site from stake cards using the bundled renderer."""
 
-    import importlib.util
-
-    spec = importlib.util.spec_from_file_location("build_site", Path("site/build_site.py"))
-    module = importlib.util.module_from_spec(spec)
-    assert spec.loader is not None
-    spec.loader.exec_module(module)  # type: ignore[arg-type]
-    module.build_site(stake_cards, out, derive_on_render=derive_on_render)
+    module = _load_site_builder()
+    module.build_site(stake_cards, out, derive_on_render=derive_on_render, workers=workers)
     typer.echo(f"Site rendered to {out}")
 
 
@@ -261,42 +262,28 @@ def filter_value(
 ):
     """Filter runners by EV and price from a stake card (PRO derived)."""
 
-    payload = json.loads(stake_card_path.read_text())
+    from turf.jsonio import load_json_cached, write_json_atomic
+    from turf.value import derive_runner_value_fields
+
+    payload = load_json_cached(stake_card_path)
     race = (payload.get("races") or [{}])[0]
     meeting = payload.get("meeting", {})
-    filtered = []
-    for runner in race.get("runners", []):
-        derived = _runner_value_fields(runner)
-        ev_val = derived.get("ev")
-        price = derived.get("price")
-        if ev_val is None or ev_val < min_ev:
-            continue
-        if isinstance(price, (int, float)) and price > max_price:
-            continue
-        filtered.append(
-            {
-                "runner_number": derived.get("runner_number"),
-                "runner_name": derived.get("runner_name"),
-                "price": price,
-                "ev": ev_val,
-                "ev_band": derived.get("ev_band"),
-                "ev_marker": derived.get("ev_marker"),
-                "value_edge": derived.get("value_edge"),
-                "risk_profile": derived.get("risk_profile"),
-            }
-        )
+    filtered = [
+        {key: derived.get(key) for key in _VALUE_FILTER_KEYS}
+        for runner in race.get("runners", [])
+        if _passes_value_filter(runner, min_ev, max_price)
+        for derived in (_runner_value_fields(runner, derive_runner_value_fields),)
+    ]
 
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(
-        json.dumps(
-            {
-                "meeting": meeting,
-                "race_number": race.get("race_number"),
-                "filters": {"min_ev": min_ev, "max_price": max_price},
-                "runners": filtered,
-            },
-            indent=2,
-        )
+    write_json_atomic(
+        out,
+        {
+            "meeting": meeting,
+            "race_number": race.get("race_number"),
+            "filters": {"min_ev": min_ev, "max_price": max_price},
+            "runners": filtered,
+        },
     )
     typer.echo(f"Wrote {out} ({len(filtered)} runners)")
 
@@ -306,10 +293,10 @@ def digest(
     stake_card_path: pathlib.Path = typer.Option(
         ..., "--stake-card", "--stake-card-path", exists=True, help="Path to stake_card_pro.json or stake_card.json"
     ),
-    out: pathlib.Path = typer.Option(Path("out/derived"), "--out", help="Output directory for digest artifacts"),
+    out: pathlib.Path = typer.Option(_DEFAULT_DERIVED_DIR, "--out", help="Output directory for digest artifacts"),
     require_positive_ev: bool = typer.Option(True, help="Require forecast.ev_1u > 0.0"),
-    min_ev: Optional[float] = typer.Option(None, help="Minimum forecast.ev_1u (optional)"),
-    min_edge: Optional[float] = typer.Option(None, help="Minimum forecast.value_edge (optional)"),
+    min_ev: float | None = typer.Option(None, help="Minimum forecast.ev_1u (optional)"),
+    min_edge: float | None = typer.Option(None, help="Minimum forecast.value_edge (optional)"),
     policy: str = typer.Option("flat", help="Stake policy: flat | kelly | fractional_kelly"),
     bankroll_start: float = typer.Option(1000.0, help="Starting bankroll for stake sizing"),
     flat_stake: float = typer.Option(20.0, help="Flat stake size (policy=flat)"),
@@ -321,7 +308,11 @@ def digest(
 ):
     """Generate a deterministic strategy digest (JSON + Markdown) from a stake card (derived-only)."""
 
-    payload = json.loads(stake_card_path.read_text())
+    from turf.digest import build_strategy_digest, write_strategy_digest
+    from turf.jsonio import load_json_cached
+    from turf.simulation import select_bets_from_stake_card, simulate_bankroll
+
+    payload = load_json_cached(stake_card_path)
     bets = select_bets_from_stake_card(
         payload,
         require_positive_ev=require_positive_ev,
@@ -367,9 +358,9 @@ def digest(
 @app.command("daily-digest")
 def daily_digest(
     stake_cards: pathlib.Path = typer.Option(
-        Path("out/cards"), "--stake-cards", exists=True, help="Directory containing stake card JSON files"
+        _DEFAULT_CARDS_DIR, "--stake-cards", exists=True, help="Directory containing stake card JSON files"
     ),
-    out: pathlib.Path = typer.Option(Path("out/derived"), "--out", help="Output directory for digest artifacts"),
+    out: pathlib.Path = typer.Option(_DEFAULT_DERIVED_DIR, "--out", help="Output directory for digest artifacts"),
     prefer_pro: bool = typer.Option(True, "--prefer-pro/--no-prefer-pro", help="Prefer stake_card_pro when available"),
     write_per_meeting: bool = typer.Option(
         False, "--write-per-meeting/--no-write-per-meeting", help="Write per-meeting digests alongside the daily index"
@@ -377,8 +368,8 @@ def daily_digest(
     require_positive_ev: bool = typer.Option(
         True, "--require-positive-ev/--no-require-positive-ev", help="Require forecast.ev_1u > 0.0 when selecting bets"
     ),
-    min_ev: Optional[float] = typer.Option(None, "--min-ev", help="Minimum forecast.ev_1u (optional)"),
-    min_edge: Optional[float] = typer.Option(None, "--min-edge", help="Minimum forecast.value_edge (optional)"),
+    min_ev: float | None = typer.Option(None, "--min-ev", help="Minimum forecast.ev_1u (optional)"),
+    min_edge: float | None = typer.Option(None, "--min-edge", help="Minimum forecast.value_edge (optional)"),
     policy: str = typer.Option("flat", "--policy", help="Stake policy: flat | kelly | fractional_kelly"),
     bankroll_start: float = typer.Option(1000.0, "--bankroll-start", help="Starting bankroll for stake sizing"),
     flat_stake: float = typer.Option(20.0, "--flat-stake", help="Flat stake size (policy=flat)"),
@@ -389,6 +380,7 @@ def daily_digest(
     ),
     iters: int = typer.Option(10_000, "--iters", help="Simulation iterations (if --simulate)"),
     seed: int = typer.Option(1337, "--seed", help="RNG seed (if --simulate)"),
+    workers: int = typer.Option(1, "--workers", min=1, help="Digest meetings in N worker processes (output unchanged)"),
 ):
     """Aggregate stake cards into a deterministic daily digest (derived-only)."""
 
@@ -410,6 +402,7 @@ def daily_digest(
         simulate=simulate,
         iters=iters,
         seed=seed,
+        workers=workers,
     )
 
     typer.echo(f"Wrote {out / 'daily_digest.json'} and {out / 'daily_digest.md'}")
@@ -429,11 +422,11 @@ def daily_digest(
 
 @app.command("backfill-digests")
 def backfill_digests(
-    from_date: Optional[str] = typer.Option(None, "--from-date", help="Start date YYYY-MM-DD (optional)"),
-    to_date: Optional[str] = typer.Option(None, "--to-date", help="End date YYYY-MM-DD (optional)"),
+    from_date: str | None = typer.Option(None, "--from-date", help="Start date YYYY-MM-DD (optional)"),
+    to_date: str | None = typer.Option(None, "--to-date", help="End date YYYY-MM-DD (optional)"),
     days: int = typer.Option(90, "--days", help="Number of days to backfill if dates are partially/unspecified"),
     out: pathlib.Path = typer.Option(Path("out/backfills"), "--out", help="Base output directory for backfill artifacts"),
-    stake_cards_dir: Optional[pathlib.Path] = typer.Option(
+    stake_cards_dir: pathlib.Path | None = typer.Option(
         None,
         "--stake-cards-dir",
         help="Optional stake cards root; uses subdir named YYYY-MM-DD when present, otherwise falls back to demo fixtures",
@@ -447,9 +440,12 @@ def backfill_digests(
     render_html: bool = typer.Option(
         True, "--render-html/--no-render-html", help="Render digest HTML wrappers under public/derived per day"
     ),
+    workers: int = typer.Option(1, "--workers", min=1, help="Digest each day's meetings in N worker processes (output unchanged)"),
 ):
     """Deterministically backfill daily digests over a date range (derived-only)."""
 
+    from turf.backfill_digests import BackfillConfig, backfill_digests as run_backfill_digests
+
     cfg = BackfillConfig(
         from_date=from_date,
         to_date=to_date,
@@ -461,6 +457,7 @@ def backfill_digests(
         seed=seed,
         write_per_meeting=write_per_meeting,
         render_html=render_html,
+        workers=workers,
     )
     index_payload = run_backfill_digests(cfg)
     dates = [d.get("date") for d in index_payload.get("dates", [])]
@@ -478,9 +475,13 @@ def view_stake_card(
 ):
     """Render a stake card in a human-friendly, read-only view."""
 
-    payload = json.loads(stake_card_path.read_text())
+    from turf.race_summary import summarize_race
+    from turf.jsonio import load_json_cached
+    from turf.value import derive_runner_value_fields
+
+    payload = load_json_cached(stake_card_path)
     race = (payload.get("races") or [{}])[0]
-    runners = [_runner_value_fields(r) for r in race.get("runners", [])]
+    runners = [_runner_value_fields(r, derive_runner_value_fields) for r in race.get("runners", [])]
     summary = race.get("race_summary") or summarize_race(race)
     lines = ["### Race summary"]
     lines.append(f"Top picks: {summary.get('top_picks') or []}")
@@ -491,7 +492,7 @@ def view_stake_card(
     lines.append("")
     lines.append("### Runners")
     formatter = _format_runner_mobile if format.lower() == "mobile" else _format_runner_pretty
-    ordered = sorted(runners, key=lambda r: (-r.get("lite_score", 0.0), r.get("runner_number") or 0))
+    ordered = sorted(runners, key=itemgetter("_sort_key"))
     lines.extend(formatter(r) for r in ordered)
     typer.echo("\n".join(lines))
 
@@ -499,11 +500,11 @@ def view_stake_card(
 @app.command("preview")
 def preview(
     stake_cards: pathlib.Path = typer.Option(
-        Path("out/cards"), "--stake-cards", exists=True, help="Directory containing stake card JSON files"
+        _DEFAULT_CARDS_DIR, "--stake-cards", exists=True, help="Directory containing stake card JSON files"
     ),
     out: pathlib.Path = typer.Option(Path("out/previews"), "--out", help="Output directory for HTML/PDF files"),
     format: str = typer.Option("html", "--format", help="Output format: html, pdf, or both"),
-    single: Optional[pathlib.Path] = typer.Option(
+    single: pathlib.Path | None = typer.Option(
         None, "--single", help="Render a single stake card file instead of directory"
     ),
     use_pro: bool = typer.Option(
@@ -555,7 +556,7 @@ def preview(
 
 @app.command("collect-stake-cards")
 def collect_stake_cards(
-    date: Optional[str] = typer.Option(
+    date: str | None = typer.Option(
         None,
         "--date",
         help="Date in YYYY-MM-DD format (default: Australia/Sydney today)",
@@ -575,7 +576,7 @@ def collect_stake_cards(
         "--odds-source",
         help="Odds source: none | fixture | theoddsapi | betfair",
     ),
-    odds_fixtures_dir: Optional[pathlib.Path] = typer.Option(
+    odds_fixtures_dir: pathlib.Path | None = typer.Option(
         None,
         "--odds-fixtures-dir",
         help="Directory containing odds fixture files (for --odds-source fixture)",
@@ -695,5 +696,13 @@ def collect_stake_cards(
     typer.echo(f"Done. Processed {meetings_count} meeting(s).")
 
 
-if __name__ == "__main__":
+def main() -> None:
+    """Console entry point: answer --version without building the Click command tree."""
+
+    if print_version_if_requested(sys.argv):
+        return
     app()
+
+
+if __name__ == "__main__":
+    main()
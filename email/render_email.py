@@ -2,46 +2,66 @@ from __future__ import annotations
 
 import argparse
 import html
-import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple
 
+import orjson
+
 
 def load_stake_cards(directory: Path) -> List[Tuple[str, dict]]:
     cards: List[Tuple[str, dict]] = []
-    for path in sorted(directory.glob("*.json")):
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted((entry.name, entry.path) for entry in it if entry.name.endswith(".json"))
+    except (FileNotFoundError, NotADirectoryError):
+        return cards
+    for name, path in entries:
         try:
-            data = json.loads(path.read_text())
-            cards.append((path.name, data))
+            with open(path, "rb") as f:
+                data = orjson.loads(f.read())
+            cards.append((name, data))
         except Exception:
             continue
     return cards
 
 
+# Escaped strings repeat heavily across a card (tags, runner numbers, names).
+_esc = lru_cache(maxsize=4096)(html.escape)
+
+_ROW_TEMPLATE = "<tr><td>{num}</td><td>{name}</td><td>{score:.3f}</td><td><span class='tag tag-{tag_lower}'>{tag}</span></td></tr>"
+
+
 def format_runner_row(runner: dict) -> str:
     score = runner.get("lite_score")
     tag = runner.get("lite_tag") or ""
-    return """<tr><td>{num}</td><td>{name}</td><td>{score:.3f}</td><td><span class='tag tag-{tag_lower}'>{tag}</span></td></tr>""".format(
-        num=html.escape(str(runner.get("runner_number", "?"))),
-        name=html.escape(runner.get("runner_name", "")),
-        score=float(score) if isinstance(score, (int, float)) else 0.0,
-        tag=html.escape(tag),
-        tag_lower=html.escape(tag.lower() if isinstance(tag, str) else "unknown"),
+    return _ROW_TEMPLATE.format_map(
+        {
+            "num": _esc(str(runner.get("runner_number", "?"))),
+            "name": _esc(runner.get("runner_name", "")),
+            "score": float(score) if isinstance(score, (int, float)) else 0.0,
+            "tag": _esc(tag),
+            "tag_lower": _esc(tag.lower() if isinstance(tag, str) else "unknown"),
+        }
     )
 
 
 def render_table(card: dict, source_name: str) -> str:
     meeting = card.get("meeting", {})
     races = card.get("races", []) or []
+    # Meeting-level fields are identical for every race block; escape them once.
+    track_html = _esc(meeting.get("track_canonical", meeting.get("meeting_id", "Unknown Track")))
+    source_html = _esc(source_name)
     blocks: List[str] = []
     for race in races:
         rows = race.get("runners", []) or []
-        runner_rows = "\n".join(format_runner_row(r) for r in rows)
+        runner_rows = "\n".join([format_runner_row(r) for r in rows])
         blocks.append(
             f"""
             <section class="race">
-              <h3>{html.escape(meeting.get('track_canonical', meeting.get('meeting_id', 'Unknown Track')))} — Race {html.escape(str(race.get('race_number', '?')))}</h3>
-              <p>Distance: {html.escape(str(race.get('distance_m', 'N/A')))}m · Source: {html.escape(source_name)}</p>
+              <h3>{track_html} — Race {_esc(str(race.get('race_number', '?')))}</h3>
+              <p>Distance: {_esc(str(race.get('distance_m', 'N/A')))}m · Source: {source_html}</p>
               <table>
                 <thead><tr><th>#</th><th>Runner</th><th>LiteScore</th><th>Tag</th></tr></thead>
                 <tbody>
@@ -55,7 +75,7 @@ def render_table(card: dict, source_name: str) -> str:
 
 
 def build_html(date_label: str, cards: List[Tuple[str, dict]]) -> str:
-    tables = "\n".join(render_table(card, name) for name, card in cards)
+    tables = "\n".join([render_table(card, name) for name, card in cards])
     empty = "<p>No stake cards were generated.</p>" if not cards else ""
     return f"""
 <!doctype html>
@@ -93,7 +113,8 @@ def main() -> None:
     cards = load_stake_cards(args.stake_cards)
     html_doc = build_html(args.date, cards)
     args.out.parent.mkdir(parents=True, exist_ok=True)
-    args.out.write_text(html_doc)
+    # The document declares charset utf-8; don't depend on the runner's locale encoding.
+    args.out.write_bytes(html_doc.encode("utf-8"))
     print(f"Rendered {len(cards)} stake cards to {args.out}")
 
 
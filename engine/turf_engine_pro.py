@@ -10,16 +10,23 @@ import hashlib
 import json
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Iterable, List, Tuple
 
 from turf.feature_flags import resolve_feature_flags
 from turf.runner_insights import derive_runner_insights, derive_trap_race
 from turf.race_summary import summarize_race
-from turf.value import derive_runner_value_fields
+from turf.value import EMPTY_BLOCK, derive_runner_value_fields
+
+
+# Checksums are defined over stdlib json's output (exponent format, ASCII escapes, NaN
+# rejection), so keep that encoder but build it once: json.dumps() with non-default
+# options constructs a fresh JSONEncoder on every call.
+_CANONICAL_ENCODER = json.JSONEncoder(ensure_ascii=True, sort_keys=True, separators=(",", ":"), allow_nan=False)
 
 
 def canonical_json(obj: object) -> str:
-    return json.dumps(obj, ensure_ascii=True, sort_keys=True, separators=(",", ":"), allow_nan=False)
+    return _CANONICAL_ENCODER.encode(obj)
 
 
 def sha256_hex(value: str) -> str:
@@ -42,7 +49,7 @@ ROLE_INDEX = {"LEAD": 0, "ON_PACE": 1, "MID": 2, "BACK": 3, "UNKNOWN": 4}
 TRACK_INDEX = {"FIRM": 0, "GOOD": 1, "SOFT": 2, "HEAVY": 3, "SYNTH": 4, "UNKNOWN": 5}
 
 
-@dataclass
+@dataclass(slots=True)
 class RunnerVector:
     runner_number: int
     x: Dict[str, object]
@@ -93,28 +100,37 @@ def _market_prob_from_prices(runners: Iterable[dict]) -> Dict[int, float]:
 
 
 def _barrier_pct(runners: List[dict]) -> Dict[int, float]:
-    present = [(r["runner_number"], r.get("barrier")) for r in runners if isinstance(r.get("barrier"), int) and r["barrier"] >= 1]
-    if not present:
-        return {r["runner_number"]: 0.5 for r in runners}
-    present_sorted = sorted(present, key=lambda t: (t[1], t[0]))
-    n = len(present_sorted)
-    denom = max(1, n - 1)
-    pct = {num: (rank - 1) / denom for rank, (num, _) in enumerate(present_sorted, start=1)}
+    pct: Dict[int, float] = {}
+    present: List[Tuple[int, int]] = []
     for r in runners:
-        pct.setdefault(r["runner_number"], 0.5)
+        num = r["runner_number"]
+        pct[num] = 0.5
+        barrier = r.get("barrier")
+        if isinstance(barrier, int) and barrier >= 1:
+            present.append((barrier, num))
+    if present:
+        present.sort()
+        denom = max(1, len(present) - 1)
+        for rank, (_, num) in enumerate(present):
+            pct[num] = rank / denom
     return pct
 
 
 def _speed_norm(runners: List[dict]) -> Dict[int, float]:
-    speeds = [(r["runner_number"], r.get("avg_speed_mps")) for r in runners if valid_speed(r.get("avg_speed_mps"))]
-    if len(speeds) < 3:
-        return {r["runner_number"]: 0.5 for r in runners}
-    values = [v for _, v in speeds]
-    vmin, vmax = min(values), max(values)
-    denom = (vmax - vmin) if (vmax - vmin) > 0 else 1.0
-    scaled = {num: (val - vmin) / denom for num, val in speeds}
+    scaled: Dict[int, float] = {}
+    speeds: List[Tuple[int, float]] = []
     for r in runners:
-        scaled.setdefault(r["runner_number"], 0.5)
+        num = r["runner_number"]
+        scaled[num] = 0.5
+        speed = r.get("avg_speed_mps")
+        if valid_speed(speed):
+            speeds.append((num, speed))
+    if len(speeds) >= 3:
+        values = [v for _, v in speeds]
+        vmin, vmax = min(values), max(values)
+        denom = (vmax - vmin) if (vmax - vmin) > 0 else 1.0
+        for num, val in speeds:
+            scaled[num] = (val - vmin) / denom
     return scaled
 
 
@@ -125,22 +141,31 @@ def _map_role_onehot(role: str | None) -> List[int]:
     return arr
 
 
-def _track_condition_onehot(raw: str | None) -> List[int]:
+# Checked in priority order: the first keyword present anywhere in the raw string wins
+# ("Soft to Good" is GOOD), so this is a scan table rather than a leftmost-match regex.
+_TRACK_KEYWORDS: Tuple[Tuple[str, int], ...] = (
+    ("FIRM", TRACK_INDEX["FIRM"]),
+    ("GOOD", TRACK_INDEX["GOOD"]),
+    ("SOFT", TRACK_INDEX["SOFT"]),
+    ("HEAVY", TRACK_INDEX["HEAVY"]),
+    ("SYN", TRACK_INDEX["SYNTH"]),
+    ("POLY", TRACK_INDEX["SYNTH"]),
+    ("TAPETA", TRACK_INDEX["SYNTH"]),
+)
+
+
+@lru_cache(maxsize=64)
+def _track_condition_index(raw: str | None) -> int:
     raw_upper = (raw or "").upper()
-    if "FIRM" in raw_upper:
-        idx = TRACK_INDEX["FIRM"]
-    elif "GOOD" in raw_upper:
-        idx = TRACK_INDEX["GOOD"]
-    elif "SOFT" in raw_upper:
-        idx = TRACK_INDEX["SOFT"]
-    elif "HEAVY" in raw_upper:
-        idx = TRACK_INDEX["HEAVY"]
-    elif "SYN" in raw_upper or "POLY" in raw_upper or "TAPETA" in raw_upper:
-        idx = TRACK_INDEX["SYNTH"]
-    else:
-        idx = TRACK_INDEX["UNKNOWN"]
+    for keyword, idx in _TRACK_KEYWORDS:
+        if keyword in raw_upper:
+            return idx
+    return TRACK_INDEX["UNKNOWN"]
+
+
+def _track_condition_onehot(raw: str | None) -> List[int]:
     arr = [0, 0, 0, 0, 0, 0]
-    arr[idx] = 1
+    arr[_track_condition_index(raw)] = 1
     return arr
 
 
@@ -217,8 +242,9 @@ def build_runner_vector(engine_inputs: dict) -> dict:
 
         vectors.append(RunnerVector(runner_number=rn, x=x))
 
-    checksum = sha256_hex(canonical_json({"runners": [v.__dict__ for v in vectors]}))
-    return {"runners": [v.__dict__ for v in vectors], "debug": {"checksum": checksum}}
+    runners = [{"runner_number": v.runner_number, "x": v.x} for v in vectors]
+    checksum = sha256_hex(canonical_json({"runners": runners}))
+    return {"runners": runners, "debug": {"checksum": checksum}}
 
 
 def _logistic(z: float) -> float:
@@ -242,6 +268,25 @@ def pro_overlay_logit_win_place_v0(
     coeffs: Dict[str, float] = COEFFS_LOGIT_WIN_PLACE_V0,
     tau: float = 0.12,
 ) -> Dict[int, Dict[str, float | None]]:
+    # Bind coefficients once; the accumulation order below is part of the forecast contract.
+    c_b0 = coeffs["b0"]
+    c_market_prob = coeffs["market_prob"]
+    c_lite_score = coeffs["lite_score"]
+    c_barrier_pct = coeffs["barrier_pct"]
+    c_speed_norm = coeffs["speed_norm"]
+    c_days_since_run = coeffs["days_since_run_norm"]
+    c_field_size = coeffs["field_size_norm"]
+    c_distance_suit = coeffs["distance_suit_norm"]
+    c_weight_eff = coeffs["weight_eff_norm"]
+    c_class_delta = coeffs["class_delta_norm"]
+    c_last600_eff = coeffs["last600_eff_norm"]
+    c_pos_delta = coeffs["pos_delta_norm"]
+    c_jockey_sr = coeffs["jockey_sr_norm"]
+    c_trainer_sr = coeffs["trainer_sr_norm"]
+    c_gear_health = coeffs["gear_health_norm"]
+    c_mr0, c_mr1, c_mr2, c_mr3, c_mr4 = (coeffs[f"map_role_onehot[{i}]"] for i in range(5))
+    c_tc0, c_tc1, c_tc2, c_tc3, c_tc4, c_tc5 = (coeffs[f"track_condition_onehot[{i}]"] for i in range(6))
+
     zs: List[float] = []
     logits: List[float] = []
     runner_numbers: List[int] = []
@@ -249,50 +294,50 @@ def pro_overlay_logit_win_place_v0(
         x = rv["x"]
         rn = rv["runner_number"]
         runner_numbers.append(rn)
-        z = coeffs["b0"]
-        z += coeffs["market_prob"] * x["market_prob"]
-        z += coeffs["lite_score"] * x["lite_score"]
-        z += coeffs["barrier_pct"] * x["barrier_pct"]
-        z += coeffs["speed_norm"] * x["speed_norm"]
-        z += coeffs["days_since_run_norm"] * x["days_since_run_norm"]
-        z += coeffs["field_size_norm"] * x["field_size_norm"]
-        z += coeffs["distance_suit_norm"] * x["distance_suit_norm"]
-        z += coeffs["weight_eff_norm"] * x["weight_eff_norm"]
-        z += coeffs["class_delta_norm"] * x["class_delta_norm"]
-        z += coeffs["last600_eff_norm"] * x["last600_eff_norm"]
-        z += coeffs["pos_delta_norm"] * x["pos_delta_norm"]
-        z += coeffs["jockey_sr_norm"] * x["jockey_sr_norm"]
-        z += coeffs["trainer_sr_norm"] * x["trainer_sr_norm"]
-        z += coeffs["gear_health_norm"] * x["gear_health_norm"]
+        z = c_b0
+        z += c_market_prob * x["market_prob"]
+        z += c_lite_score * x["lite_score"]
+        z += c_barrier_pct * x["barrier_pct"]
+        z += c_speed_norm * x["speed_norm"]
+        z += c_days_since_run * x["days_since_run_norm"]
+        z += c_field_size * x["field_size_norm"]
+        z += c_distance_suit * x["distance_suit_norm"]
+        z += c_weight_eff * x["weight_eff_norm"]
+        z += c_class_delta * x["class_delta_norm"]
+        z += c_last600_eff * x["last600_eff_norm"]
+        z += c_pos_delta * x["pos_delta_norm"]
+        z += c_jockey_sr * x["jockey_sr_norm"]
+        z += c_trainer_sr * x["trainer_sr_norm"]
+        z += c_gear_health * x["gear_health_norm"]
         mr = x["map_role_onehot"]
         tc = x["track_condition_onehot"]
-        z += coeffs["map_role_onehot[0]"] * mr[0]
-        z += coeffs["map_role_onehot[1]"] * mr[1]
-        z += coeffs["map_role_onehot[2]"] * mr[2]
-        z += coeffs["map_role_onehot[3]"] * mr[3]
-        z += coeffs["map_role_onehot[4]"] * mr[4]
-        z += coeffs["track_condition_onehot[0]"] * tc[0]
-        z += coeffs["track_condition_onehot[1]"] * tc[1]
-        z += coeffs["track_condition_onehot[2]"] * tc[2]
-        z += coeffs["track_condition_onehot[3]"] * tc[3]
-        z += coeffs["track_condition_onehot[4]"] * tc[4]
-        z += coeffs["track_condition_onehot[5]"] * tc[5]
+        z += c_mr0 * mr[0]
+        z += c_mr1 * mr[1]
+        z += c_mr2 * mr[2]
+        z += c_mr3 * mr[3]
+        z += c_mr4 * mr[4]
+        z += c_tc0 * tc[0]
+        z += c_tc1 * tc[1]
+        z += c_tc2 * tc[2]
+        z += c_tc3 * tc[3]
+        z += c_tc4 * tc[4]
+        z += c_tc5 * tc[5]
         zs.append(z)
         logits.append(_logistic(z))
 
     p_win = _softmax(logits, tau)
 
     market_prob = [rv["x"]["market_prob"] for rv in runner_vectors]
-    n = len(runner_vectors)
+    # Same per-term arithmetic and k order as the textbook double sum (bit-identical);
+    # only the 1 - p_win[k] denominators are hoisted. Skipping a 0.0 term is exact here.
+    win_denoms = [(pk, 1.0 - pk) for pk in p_win]
     p_place: List[float] = []
-    for i in range(n):
+    for i, pi in enumerate(p_win):
         acc = 0.0
-        for k in range(n):
-            if k == i:
-                continue
-            denom = 1.0 - p_win[k]
-            acc += p_win[k] * (p_win[i] / denom) if denom > 0 else 0.0
-        p_place.append(clamp(p_win[i] + acc, 0.0, 1.0))
+        for pk, denom in win_denoms[:i] + win_denoms[i + 1 :]:
+            if denom > 0:
+                acc += pk * (pi / denom)
+        p_place.append(clamp(pi + acc, 0.0, 1.0))
 
     warnings_set = set(warnings or [])
     if degrade_mode == "NORMAL" and not warnings_set:
@@ -321,6 +366,27 @@ def pro_overlay_logit_win_place_v0(
     return forecasts
 
 
+def _copy_card_for_overlay(stake_card: dict) -> dict:
+    """Copy exactly the containers the overlay writes to (card, races, runners, engine_context, debug).
+
+    Subtrees the overlay only reads (meeting, odds/components blocks, warnings) stay shared
+    with the input, which is never mutated.
+    """
+
+    output = dict(stake_card)
+    if "races" in stake_card:
+        output["races"] = [
+            {**race, "runners": [dict(runner) for runner in race["runners"]]} if "runners" in race else dict(race)
+            for race in stake_card["races"]
+        ]
+    ctx = stake_card.get("engine_context")
+    if isinstance(ctx, dict):
+        ctx = output["engine_context"] = dict(ctx)
+        if isinstance(ctx.get("debug"), dict):
+            ctx["debug"] = dict(ctx["debug"])
+    return output
+
+
 def apply_pro_overlay_to_stake_card(
     stake_card: dict,
     runner_vector_payload: dict,
@@ -330,12 +396,14 @@ def apply_pro_overlay_to_stake_card(
     tau: float = 0.12,
     feature_flags: Dict[str, bool] | None = None,
 ) -> dict:
-    output = json.loads(json.dumps(stake_card))  # deep copy
+    output = _copy_card_for_overlay(stake_card)
     flags = resolve_feature_flags(feature_flags)
     enable_summary = bool(flags.get("enable_runner_narratives"))
     enable_fitness = bool(flags.get("enable_runner_fitness"))
     enable_risk = bool(flags.get("enable_runner_risk"))
     enable_trap = bool(flags.get("enable_trap_race"))
+    enable_ev = bool(flags.get("ev_bands"))
+    enable_race_summary = bool(flags.get("race_summary"))
     any_insights = enable_summary or enable_fitness or enable_risk
     races = output.get("races", [])
     for race in races:
@@ -343,7 +411,7 @@ def apply_pro_overlay_to_stake_card(
             rn = runner.get("runner_number")
             if rn in forecasts:
                 runner["forecast"] = forecasts[rn]
-                if flags.get("ev_bands"):
+                if enable_ev:
                     derived = derive_runner_value_fields(runner)
                     runner.update(derived)
             if any_insights:
@@ -355,7 +423,7 @@ def apply_pro_overlay_to_stake_card(
                 )
                 if insights:
                     runner.update(insights)
-        if flags.get("race_summary"):
+        if enable_race_summary:
             race["race_summary"] = summarize_race(race)
         if enable_trap and derive_trap_race(race, output.get("engine_context", {})):
             race["trap_race"] = True
@@ -385,7 +453,7 @@ def build_runner_vector_from_stake_card(stake_card: dict) -> dict:
         "runners": [],
     }
     for runner in runners:
-        odds_block = runner.get("odds_minimal") or {}
+        odds_block = runner.get("odds_minimal") or EMPTY_BLOCK
         engine_inputs["runners"].append(
             {
                 "runner_number": runner.get("runner_number"),
@@ -400,17 +468,19 @@ def build_runner_vector_from_stake_card(stake_card: dict) -> dict:
     return build_runner_vector(engine_inputs)
 
 
+def stake_card_prices(stake_card: dict) -> Dict[int, float | None]:
+    race = (stake_card.get("races") or [{}])[0]
+    return {
+        runner.get("runner_number"): (runner.get("odds_minimal") or EMPTY_BLOCK).get("price_now_dec")
+        for runner in race.get("runners", [])
+    }
+
+
 def overlay_from_stake_card(stake_card: dict) -> Tuple[dict, Dict[int, Dict[str, float | None]]]:
     runner_vector_payload = build_runner_vector_from_stake_card(stake_card)
-    prices = {}
-    race = (stake_card.get("races") or [{}])[0]
-    for runner in race.get("runners", []):
-        rn = runner.get("runner_number")
-        odds_block = runner.get("odds_minimal") or {}
-        prices[rn] = odds_block.get("price_now_dec")
     forecasts = pro_overlay_logit_win_place_v0(
         runner_vector_payload.get("runners", []),
-        prices,
+        stake_card_prices(stake_card),
         stake_card.get("engine_context", {}).get("degrade_mode", "NORMAL"),
         stake_card.get("engine_context", {}).get("warnings", []),
     )
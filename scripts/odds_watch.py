@@ -11,12 +11,18 @@ Or install with extras:
 from __future__ import annotations
 
 import argparse
+import asyncio
 import hashlib
-import json
 import time
+from collections import deque
+from contextlib import ExitStack
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Deque, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import orjson
 
 # Optional dependencies
 try:
@@ -26,11 +32,19 @@ except ImportError:
     HTTPX_AVAILABLE = False
 
 try:
+    from lxml import etree as lxml_etree
     from lxml import html as lxml_html
     LXML_AVAILABLE = True
 except ImportError:
     LXML_AVAILABLE = False
 
+if LXML_AVAILABLE:
+    # Compiled once; .xpath("...") would re-compile the expression on every call.
+    # This is a placeholder selector - customize per source.
+    _ODDS_TABLES_XPATH = lxml_etree.XPath("//table[contains(@class, 'odds') or contains(@class, 'runner')]")
+    _ROWS_XPATH = lxml_etree.XPath(".//tr")
+    _CELLS_XPATH = lxml_etree.XPath(".//td")
+
 
 def check_dependencies() -> None:
     """Check that required dependencies are available."""
@@ -48,58 +62,77 @@ def check_dependencies() -> None:
         )
 
 
-def fetch_url(url: str, timeout: float = 30.0) -> tuple[str, int]:
-    """Fetch URL content.
+def _next_etag(status_code: int, response_etag: Optional[str], etag: Optional[str]) -> Optional[str]:
+    """ETag to send with the next poll.
 
-    Returns:
-        Tuple of (html_content, status_code)
+    Only pages whose odds were captured (200, or a 304 reusing them) are revalidated, so a
+    304 always has a parsed snapshot to fall back on.
     """
-    check_dependencies()
+    if status_code == 200:
+        return response_etag
+    if status_code == 304:
+        return response_etag or etag
+    return None
+
 
-    with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-        response = client.get(url)
-        return response.text, response.status_code
+@lru_cache(maxsize=8)
+def _html_parser(encoding: str) -> "lxml_html.HTMLParser":
+    return lxml_html.HTMLParser(encoding=encoding)
 
 
-def parse_odds_simple(html_content: str) -> List[Dict[str, Any]]:
+def parse_odds_simple(html_content: str | bytes, encoding: Optional[str] = None) -> List[Dict[str, Any]]:
     """Parse odds from HTML using simple table detection.
 
     This is a generic parser that looks for odds tables.
     Customize for specific sites as needed.
+
+    ``html_content`` may be the raw response body; pass the response ``encoding`` so
+    lxml decodes it the same way as ``response.text`` (no str round-trip).
     """
     check_dependencies()
 
-    doc = lxml_html.fromstring(html_content)
+    if isinstance(html_content, bytes) and encoding:
+        doc = lxml_html.fromstring(html_content, parser=_html_parser(encoding))
+    else:
+        doc = lxml_html.fromstring(html_content)
     odds_data = []
 
     # Look for common odds table patterns
-    # This is a placeholder - customize selectors per source
-    tables = doc.xpath("//table[contains(@class, 'odds') or contains(@class, 'runner')]")
+    tables = _ODDS_TABLES_XPATH(doc)
 
     for table in tables:
-        rows = table.xpath(".//tr")
+        rows = _ROWS_XPATH(table)
         for row in rows:
-            cells = row.xpath(".//td")
+            cells = _CELLS_XPATH(row)
             if len(cells) >= 2:
                 # Try to extract runner number and price
-                runner_text = cells[0].text_content().strip()
+                runner_head = cells[0].text_content().strip().split(".")[0].strip()
+                # Header/label rows can't start a number; skip them before int()
+                # raises, and without reading the price cell.
+                if not runner_head or not (runner_head[0].isdigit() or runner_head[0] in "+-"):
+                    continue
                 price_text = cells[-1].text_content().strip()
 
                 try:
                     # Try to parse as number
-                    runner_num = int(runner_text.split(".")[0].strip())
+                    runner_num = int(runner_head)
                     price = float(price_text.replace("$", "").strip())
-
-                    odds_data.append({
-                        "runner_number": runner_num,
-                        "price": price,
-                    })
-                except (ValueError, IndexError):
+                except ValueError:
                     continue
 
+                odds_data.append({
+                    "runner_number": runner_num,
+                    "price": price,
+                })
+
     return odds_data
 
 
+def utc_now_iso() -> str:
+    """Current UTC time as an ISO-8601 string (the snapshot ``timestamp`` format)."""
+    return datetime.now(timezone.utc).isoformat()
+
+
 def create_snapshot(
     url: str,
     meeting_id: str,
@@ -107,10 +140,11 @@ def create_snapshot(
     odds_data: List[Dict[str, Any]],
     html_hash: str,
     status_code: int,
+    timestamp: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Create a snapshot record."""
+    """Create a snapshot record (``timestamp`` defaults to now, UTC ISO-8601)."""
     return {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": timestamp or utc_now_iso(),
         "meeting_id": meeting_id,
         "race_number": race_number,
         "url": url,
@@ -121,12 +155,110 @@ def create_snapshot(
     }
 
 
-def append_snapshot(snapshot: Dict[str, Any], output_file: Path) -> None:
-    """Append snapshot to JSONL file."""
+def open_snapshot_log(output_file: Path) -> IO[bytes]:
+    """Open a JSONL snapshot log for appending (kept open for a whole watch)."""
     output_file.parent.mkdir(parents=True, exist_ok=True)
+    return open(output_file, "ab")
+
+
+def write_snapshot(snapshot: Dict[str, Any], log: IO[bytes]) -> None:
+    """Write one snapshot line (compact orjson, UTF-8) to an open log.
+
+    Flushed per record so an interrupted watch loses nothing already captured; this
+    costs one write() per poll instead of an open/write/close.
+    """
+    log.write(orjson.dumps(snapshot, option=orjson.OPT_APPEND_NEWLINE))
+    log.flush()
+
+
+def build_poll_snapshot(
+    url: str,
+    meeting_id: str,
+    race_number: int,
+    html_content: str | bytes,
+    status_code: int,
+    previous: Optional[Dict[str, Any]] = None,
+    encoding: Optional[str] = None,
+    timestamp: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Hash and parse one fetched page into a snapshot record.
+
+    ``html_content`` is either decoded text or the raw body plus its ``encoding``; raw
+    bodies are hashed and parsed as-is. If ``previous`` (the last snapshot for the same
+    target) has odds for the same ``html_hash``, they are reused instead of parsing the
+    page again. A ``304 Not Modified`` carries no body and reuses ``previous``'s hash and odds.
+    """
+    has_odds = previous is not None and previous.get("status_code") in (200, 304)
+    if status_code == 304 and has_odds:
+        return create_snapshot(
+            url=url,
+            meeting_id=meeting_id,
+            race_number=race_number,
+            odds_data=previous["odds"],
+            html_hash=previous["html_hash"],
+            status_code=status_code,
+            timestamp=timestamp,
+        )
+
+    html_bytes = html_content if isinstance(html_content, bytes) else html_content.encode()
+    html_hash = hashlib.md5(html_bytes).hexdigest()[:12]
+
+    if status_code != 200:
+        odds_data = []
+    elif has_odds and previous.get("html_hash") == html_hash:
+        odds_data = previous["odds"]
+    else:
+        odds_data = parse_odds_simple(html_content, encoding)
+
+    return create_snapshot(
+        url=url,
+        meeting_id=meeting_id,
+        race_number=race_number,
+        odds_data=odds_data,
+        html_hash=html_hash,
+        status_code=status_code,
+        timestamp=timestamp,
+    )
+
+
+def create_error_snapshot(
+    url: str,
+    meeting_id: str,
+    race_number: int,
+    error: Exception,
+    timestamp: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Create the record written when a poll fails."""
+    return {
+        "timestamp": timestamp or utc_now_iso(),
+        "meeting_id": meeting_id,
+        "race_number": race_number,
+        "url": url,
+        "error": str(error),
+    }
+
+
+def _log_poll(prefix: str, snapshot: Dict[str, Any]) -> None:
+    if "error" in snapshot:
+        print(f"{prefix} ERROR: {snapshot['error']}")
+        return
+    ts = snapshot["timestamp"][:19]
+    print(
+        f"{prefix} {ts} | status={snapshot['status_code']} | runners={snapshot['runner_count']} "
+        f"| hash={snapshot['html_hash']}"
+    )
 
-    with open(output_file, "a") as f:
-        f.write(json.dumps(snapshot) + "\n")
+
+def _next_deadline(deadline: float, interval_seconds: float, now: float) -> float:
+    """Return the next poll slot on the fixed ``interval_seconds`` grid after ``deadline``.
+
+    Slots that passed while a slow fetch was running are skipped, so a late poll fires
+    once immediately instead of as a burst of back-to-back catch-up requests.
+    """
+    deadline += interval_seconds
+    if interval_seconds > 0 and deadline < now:
+        deadline += ((now - deadline) // interval_seconds) * interval_seconds
+    return deadline
 
 
 def watch_odds(
@@ -137,9 +269,14 @@ def watch_odds(
     interval_seconds: int = 60,
     duration_minutes: int = 30,
     verbose: bool = True,
-) -> List[Dict[str, Any]]:
+    keep_last: Optional[int] = 128,
+    transport: Optional["httpx.AsyncBaseTransport"] = None,
+) -> Deque[Dict[str, Any]]:
     """Watch odds page and capture snapshots.
 
+    Runs :func:`watch_many_async` for a single target, so both entry points share one
+    poll loop.
+
     Args:
         url: URL to fetch
         meeting_id: Meeting identifier
@@ -148,17 +285,15 @@ def watch_odds(
         interval_seconds: Seconds between fetches
         duration_minutes: Total duration to watch
         verbose: Print progress
+        keep_last: Snapshots kept in memory for the return value (None keeps all);
+            the JSONL file always has the full history
+        transport: Replaces the client's network transport, as in :func:`watch_many_async`
 
     Returns:
-        List of captured snapshots
+        The most recent ``keep_last`` snapshots, oldest first
     """
     check_dependencies()
 
-    snapshots = []
-    start_time = time.time()
-    end_time = start_time + (duration_minutes * 60)
-    iteration = 0
-
     if verbose:
         print(f"Starting odds watch for {meeting_id} R{race_number}")
         print(f"URL: {url}")
@@ -166,59 +301,163 @@ def watch_odds(
         print(f"Output: {output_file}")
         print("-" * 50)
 
-    while time.time() < end_time:
+    target = {"url": url, "meeting_id": meeting_id, "race_number": race_number, "output_file": output_file}
+    (snapshots,) = asyncio.run(
+        watch_many_async(
+            [target], interval_seconds, duration_minutes, verbose, keep_last=keep_last, transport=transport
+        )
+    )
+
+    if verbose:
+        print("-" * 50)
+        print("Completed")
+
+    return snapshots
+
+
+async def _watch_target(
+    client: "httpx.AsyncClient",
+    host_limits: Dict[str, asyncio.Semaphore],
+    target: Dict[str, Any],
+    log: IO[bytes],
+    interval_seconds: float,
+    end_time: float,
+    verbose: bool,
+    keep_last: Optional[int],
+) -> Deque[Dict[str, Any]]:
+    url = target["url"]
+    meeting_id = target["meeting_id"]
+    race_number = target["race_number"]
+    limit = host_limits[urlsplit(url).netloc]
+
+    snapshots: Deque[Dict[str, Any]] = deque(maxlen=keep_last)
+    previous: Optional[Dict[str, Any]] = None
+    etag: Optional[str] = None
+    deadline = time.monotonic()
+    iteration = 0
+    while time.monotonic() < end_time:
         iteration += 1
+        polled_at = utc_now_iso()
         try:
-            html_content, status_code = fetch_url(url)
-            html_hash = hashlib.md5(html_content.encode()).hexdigest()[:12]
-
-            if status_code == 200:
-                odds_data = parse_odds_simple(html_content)
-            else:
-                odds_data = []
-
-            snapshot = create_snapshot(
-                url=url,
-                meeting_id=meeting_id,
-                race_number=race_number,
-                odds_data=odds_data,
-                html_hash=html_hash,
-                status_code=status_code,
+            async with limit:
+                response = await client.get(url, headers={"If-None-Match": etag} if etag else None)
+            snapshot = build_poll_snapshot(
+                url,
+                meeting_id,
+                race_number,
+                response.content,
+                response.status_code,
+                previous,
+                response.encoding,
+                timestamp=polled_at,
             )
+            etag = _next_etag(response.status_code, response.headers.get("ETag"), etag)
+        except Exception as e:
+            snapshot = create_error_snapshot(url, meeting_id, race_number, e, timestamp=polled_at)
+            etag = None
+        previous = snapshot
+
+        # Single event loop thread: lines from targets sharing a log never interleave.
+        write_snapshot(snapshot, log)
+        snapshots.append(snapshot)
+        if verbose:
+            _log_poll(f"[{meeting_id} R{race_number} #{iteration}]", snapshot)
+
+        deadline = _next_deadline(deadline, interval_seconds, time.monotonic())
+        if deadline >= end_time:
+            break
+        delay = deadline - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    return snapshots
 
-            append_snapshot(snapshot, output_file)
-            snapshots.append(snapshot)
 
-            if verbose:
-                ts = snapshot["timestamp"][:19]
-                print(f"[{iteration}] {ts} | status={status_code} | runners={len(odds_data)} | hash={html_hash}")
+async def watch_many_async(
+    targets: List[Dict[str, Any]],
+    interval_seconds: float = 60,
+    duration_minutes: float = 30,
+    verbose: bool = True,
+    max_per_host: int = 4,
+    timeout: float = 30.0,
+    keep_last: Optional[int] = 128,
+    transport: Optional["httpx.AsyncBaseTransport"] = None,
+) -> List[Deque[Dict[str, Any]]]:
+    """Watch several races concurrently from one event loop.
+
+    Each target is a dict with ``url``, ``meeting_id``, ``race_number`` and ``output_file``.
+    All targets share one ``httpx.AsyncClient``; in-flight requests per host are capped
+    at ``max_per_host`` so a meeting's pages are not fetched in a burst. ``transport``
+    replaces the client's network transport (e.g. ``httpx.MockTransport``).
 
-        except Exception as e:
-            if verbose:
-                print(f"[{iteration}] ERROR: {e}")
-
-            # Record error snapshot
-            error_snapshot = {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "meeting_id": meeting_id,
-                "race_number": race_number,
-                "url": url,
-                "error": str(e),
-            }
-            append_snapshot(error_snapshot, output_file)
-            snapshots.append(error_snapshot)
-
-        # Wait for next interval (unless we've exceeded duration)
-        if time.time() + interval_seconds < end_time:
-            time.sleep(interval_seconds)
-        else:
-            break
+    Returns:
+        The most recent ``keep_last`` snapshots per target, in ``targets`` order
+    """
+    check_dependencies()
 
-    if verbose:
-        print("-" * 50)
-        print(f"Completed: {len(snapshots)} snapshots captured")
+    end_time = time.monotonic() + (duration_minutes * 60)
+    host_limits = {
+        host: asyncio.Semaphore(max_per_host) for host in {urlsplit(t["url"]).netloc for t in targets}
+    }
+    limits = httpx.Limits(
+        max_connections=64,
+        max_keepalive_connections=32,
+        keepalive_expiry=max(interval_seconds * 2, 120),
+    )
+    with ExitStack() as stack:
+        # One handle per distinct output file; targets may share a log.
+        logs: Dict[Path, IO[bytes]] = {}
+        for target in targets:
+            path = Path(target["output_file"])
+            if path not in logs:
+                logs[path] = stack.enter_context(open_snapshot_log(path))
+
+        async with httpx.AsyncClient(
+            timeout=timeout, follow_redirects=True, limits=limits, transport=transport
+        ) as client:
+            return list(
+                await asyncio.gather(
+                    *(
+                        _watch_target(
+                            client,
+                            host_limits,
+                            target,
+                            logs[Path(target["output_file"])],
+                            interval_seconds,
+                            end_time,
+                            verbose,
+                            keep_last,
+                        )
+                        for target in targets
+                    )
+                )
+            )
 
-    return snapshots
+
+def watch_many(
+    targets: List[Dict[str, Any]],
+    interval_seconds: float = 60,
+    duration_minutes: float = 30,
+    verbose: bool = True,
+    keep_last: Optional[int] = 128,
+) -> List[Deque[Dict[str, Any]]]:
+    """Synchronous entry point for :func:`watch_many_async`."""
+    return asyncio.run(
+        watch_many_async(targets, interval_seconds, duration_minutes, verbose, keep_last=keep_last)
+    )
+
+
+def load_targets(path: Path, default_output: Path) -> List[Dict[str, Any]]:
+    """Read watch targets from a JSON list of ``{url, meeting_id, race[, out]}`` objects."""
+    raw = orjson.loads(path.read_bytes())
+    return [
+        {
+            "url": item["url"],
+            "meeting_id": item["meeting_id"],
+            "race_number": int(item["race"]),
+            "output_file": Path(item.get("out") or default_output),
+        }
+        for item in raw
+    ]
 
 
 def main() -> None:
@@ -228,21 +467,24 @@ def main() -> None:
     parser.add_argument(
         "--url",
         type=str,
-        required=True,
         help="URL to fetch odds from",
     )
     parser.add_argument(
         "--meeting-id",
         type=str,
-        required=True,
         help="Meeting identifier",
     )
     parser.add_argument(
         "--race",
         type=int,
-        required=True,
         help="Race number",
     )
+    parser.add_argument(
+        "--targets",
+        type=Path,
+        default=None,
+        help="JSON list of {url, meeting_id, race[, out]} to watch concurrently (replaces --url/--meeting-id/--race)",
+    )
     parser.add_argument(
         "--out",
         type=Path,
@@ -267,6 +509,8 @@ def main() -> None:
         help="Suppress progress output",
     )
     args = parser.parse_args()
+    if args.targets is None and (args.url is None or args.meeting_id is None or args.race is None):
+        parser.error("--url, --meeting-id and --race are required unless --targets is given")
 
     try:
         check_dependencies()
@@ -274,6 +518,15 @@ def main() -> None:
         print(f"ERROR: {e}")
         raise SystemExit(1)
 
+    if args.targets is not None:
+        watch_many(
+            load_targets(args.targets, args.out),
+            interval_seconds=args.interval,
+            duration_minutes=args.duration,
+            verbose=not args.quiet,
+        )
+        return
+
     watch_odds(
         url=args.url,
         meeting_id=args.meeting_id,
@@ -22,14 +22,20 @@ Install with: pip install weasyprint
 from __future__ import annotations
 
 import argparse
-import json
-from datetime import datetime
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import orjson
 
 # PDF rendering is optional
 try:
     from weasyprint import HTML as WeasyHTML
+    from weasyprint.text.fonts import FontConfiguration
     WEASYPRINT_AVAILABLE = True
 except ImportError:
     WEASYPRINT_AVAILABLE = False
@@ -182,8 +188,8 @@ def render_race(race: Dict[str, Any], meeting: Dict[str, Any]) -> str:
     """Render a single race section."""
     runners = race.get("runners", [])
 
-    # Sort by lite_score descending
-    sorted_runners = sorted(runners, key=lambda r: -(r.get("lite_score") or 0))
+    # Sort by lite_score descending (reverse=True keeps ties in card order, as the negated key did)
+    sorted_runners = sorted(runners, key=lambda r: r.get("lite_score") or 0, reverse=True)
 
     runner_rows = []
     for i, runner in enumerate(sorted_runners):
@@ -217,8 +223,14 @@ def render_race(race: Dict[str, Any], meeting: Dict[str, Any]) -> str:
     """
 
 
-def render_preview_html(stake_card: Dict[str, Any]) -> str:
-    """Render full preview HTML document."""
+def render_preview_html(stake_card: Dict[str, Any], generated_at: Optional[str] = None) -> str:
+    """Render full preview HTML document.
+
+    ``generated_at`` is the footer timestamp; defaults to the current UTC minute.
+    """
+    if generated_at is None:
+        generated_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+
     meeting = stake_card.get("meeting", {})
     races = stake_card.get("races", [])
     engine_context = stake_card.get("engine_context", {})
@@ -259,7 +271,7 @@ def render_preview_html(stake_card: Dict[str, Any]) -> str:
     {''.join(race_sections)}
 
     <div class="footer">
-        Generated by TURF ENGINE LITE | {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}
+        Generated by TURF ENGINE LITE | {generated_at}
         <br>
         Forecasts are for informational purposes only. Lite ordering is deterministic and unchanged by overlays.
     </div>
@@ -267,6 +279,12 @@ def render_preview_html(stake_card: Dict[str, Any]) -> str:
 </html>"""
 
 
+@lru_cache(maxsize=None)
+def _font_config() -> "FontConfiguration":
+    """One WeasyPrint font configuration per process, shared by every PDF render."""
+    return FontConfiguration()
+
+
 def render_preview_pdf(html_content: str, output_path: Path) -> bool:
     """Render HTML to PDF using WeasyPrint.
 
@@ -276,14 +294,119 @@ def render_preview_pdf(html_content: str, output_path: Path) -> bool:
         return False
 
     doc = WeasyHTML(string=html_content)
-    doc.write_pdf(output_path)
+    doc.write_pdf(output_path, font_config=_font_config())
     return True
 
 
+def _preview_base_name(card: Dict[str, Any], stake_file: Path) -> str:
+    meeting = card.get("meeting", {})
+    return f"{meeting.get('date_local', 'unknown')}_{meeting.get('meeting_id', stake_file.stem)}"
+
+
+def _preview_result(stake_file: Path, card: Dict[str, Any], output_dir: Path) -> Dict[str, Any]:
+    """Result record for one card, naming the HTML preview it owns (PDF not yet known)."""
+    meeting = card.get("meeting", {})
+    return {
+        "stake_card": str(stake_file),
+        "meeting_id": meeting.get("meeting_id", stake_file.stem),
+        "date": meeting.get("date_local", "unknown"),
+        "html": str(output_dir / f"{_preview_base_name(card, stake_file)}.html"),
+        "pdf": None,
+    }
+
+
+def _render_card(
+    stake_file: Path,
+    card: Dict[str, Any],
+    output_dir: Path,
+    generate_pdf: bool,
+    generated_at: str,
+) -> Dict[str, Any]:
+    """Write the HTML (and optional PDF) preview for one loaded stake card."""
+    result = _preview_result(stake_file, card, output_dir)
+
+    # Render HTML
+    html_content = render_preview_html(card, generated_at)
+    html_path = Path(result["html"])
+    # The document declares charset UTF-8; don't depend on the runner's locale encoding.
+    html_path.write_bytes(html_content.encode("utf-8"))
+
+    # Render PDF if requested
+    if generate_pdf:
+        pdf_path = html_path.with_suffix(".pdf")
+        if render_preview_pdf(html_content, pdf_path):
+            result["pdf"] = str(pdf_path)
+        else:
+            result["pdf_error"] = "weasyprint not installed"
+
+    return result
+
+
+def _render_group(
+    group: List[Tuple[int, Path, Dict[str, Any]]],
+    output_dir: Path,
+    generate_pdf: bool,
+    generated_at: str,
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """Render cards that share output files, in order (worker-process entry point)."""
+    return [
+        (index, _render_card(stake_file, card, output_dir, generate_pdf, generated_at))
+        for index, stake_file, card in group
+    ]
+
+
+def _cached_result(
+    stake_file: Path,
+    card: Dict[str, Any],
+    output_dir: Path,
+    generate_pdf: bool,
+) -> Optional[Dict[str, Any]]:
+    """Result for a card whose outputs from an earlier run are still on disk, else None."""
+    result = _preview_result(stake_file, card, output_dir)
+    html_path = Path(result["html"])
+    if not html_path.exists():
+        return None
+    if generate_pdf:
+        if not WEASYPRINT_AVAILABLE:
+            result["pdf_error"] = "weasyprint not installed"
+        else:
+            pdf_path = html_path.with_suffix(".pdf")
+            if not pdf_path.exists():
+                return None
+            result["pdf"] = str(pdf_path)
+    return result
+
+
+# Sidecar mapping each output base name to the SHA-256 of the card that last rendered it.
+# Bump the version whenever the generated markup changes so stale previews are redone.
+RENDER_CACHE_FILE = ".cache.json"
+RENDER_CACHE_VERSION = 1
+
+
+def _load_render_cache(output_dir: Path) -> Dict[str, str]:
+    try:
+        raw = orjson.loads((output_dir / RENDER_CACHE_FILE).read_bytes())
+    except (orjson.JSONDecodeError, OSError):
+        return {}
+    if not isinstance(raw, dict) or raw.get("version") != RENDER_CACHE_VERSION:
+        return {}
+    cards = raw.get("cards")
+    return cards if isinstance(cards, dict) else {}
+
+
+def _save_render_cache(output_dir: Path, cache: Dict[str, str]) -> None:
+    payload = {"version": RENDER_CACHE_VERSION, "cards": cache}
+    (output_dir / RENDER_CACHE_FILE).write_bytes(
+        orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    )
+
+
 def render_previews(
     stake_cards_dir: Path,
     output_dir: Path,
     generate_pdf: bool = True,
+    workers: int = 1,
+    incremental: bool = False,
 ) -> List[Dict[str, Any]]:
     """Render previews for all stake cards in a directory.
 
@@ -291,51 +414,83 @@ def render_previews(
         stake_cards_dir: Directory containing stake card JSON files
         output_dir: Directory for output files
         generate_pdf: Whether to generate PDF (requires weasyprint)
+        workers: Render in N worker processes (output unchanged)
+        incremental: Skip cards whose bytes match the card that last rendered their
+            output files (tracked in ``output_dir/.cache.json``) while those files exist
 
     Returns:
         List of generated file info
     """
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    generated = []
     stake_files = sorted(stake_cards_dir.glob("*.json"))
+    # One footer timestamp for the whole batch.
+    generated_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
 
+    loaded: List[Tuple[Path, Dict[str, Any], str]] = []
     for stake_file in stake_files:
         try:
-            card = json.loads(stake_file.read_text())
-        except (json.JSONDecodeError, IOError):
+            raw = stake_file.read_bytes()
+            card = orjson.loads(raw)
+        except (orjson.JSONDecodeError, OSError):
             continue
+        loaded.append((stake_file, card, hashlib.sha256(raw).hexdigest() if incremental else ""))
+
+    base_names = [_preview_base_name(card, stake_file) for stake_file, card, _ in loaded]
+    unchanged: Set[str] = set()
+    if incremental:
+        # Only the last card for a base name decides what is on disk, so a group of
+        # cards sharing output files is skipped or re-rendered as a whole.
+        owners = {base_name: index for index, base_name in enumerate(base_names)}
+        cache = _load_render_cache(output_dir)
+        for base_name, index in owners.items():
+            stake_file, card, digest = loaded[index]
+            up_to_date = cache.get(base_name) == digest
+            if up_to_date and _cached_result(stake_file, card, output_dir, generate_pdf) is not None:
+                unchanged.add(base_name)
+            cache[base_name] = digest
+    else:
+        # A full run rewrites outputs without tracking them; drop any stale record.
+        (output_dir / RENDER_CACHE_FILE).unlink(missing_ok=True)
+
+    results: Dict[int, Dict[str, Any]] = {}
+    pending: List[Tuple[int, Path, Dict[str, Any]]] = []
+    for index, (stake_file, card, _) in enumerate(loaded):
+        if base_names[index] in unchanged:
+            cached = _cached_result(stake_file, card, output_dir, generate_pdf)
+            if cached is not None:
+                results[index] = cached
+                continue
+        pending.append((index, stake_file, card))
+
+    # The script is run as __main__ or loaded from its file path (tests), which spawned
+    # workers cannot import, so the pool needs fork; without it rendering stays serial.
+    if workers <= 1 or len(pending) <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        for index, stake_file, card in pending:
+            results[index] = _render_card(stake_file, card, output_dir, generate_pdf, generated_at)
+    else:
+        # Cards for the same (date, meeting) write the same files; keep each such group in
+        # one task, in sorted order, so the last card still wins as in the serial loop.
+        groups: Dict[str, List[Tuple[int, Path, Dict[str, Any]]]] = {}
+        for item in pending:
+            groups.setdefault(base_names[item[0]], []).append(item)
+
+        render_group = partial(
+            _render_group,
+            output_dir=output_dir,
+            generate_pdf=generate_pdf,
+            generated_at=generated_at,
+        )
+        workers = min(workers, len(groups))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as pool:
+            for group_results in pool.map(
+                render_group, groups.values(), chunksize=max(1, len(groups) // (4 * workers))
+            ):
+                results.update(group_results)
 
-        meeting = card.get("meeting", {})
-        meeting_id = meeting.get("meeting_id", stake_file.stem)
-        date = meeting.get("date_local", "unknown")
-
-        base_name = f"{date}_{meeting_id}"
-
-        # Render HTML
-        html_content = render_preview_html(card)
-        html_path = output_dir / f"{base_name}.html"
-        html_path.write_text(html_content)
-
-        result = {
-            "stake_card": str(stake_file),
-            "meeting_id": meeting_id,
-            "date": date,
-            "html": str(html_path),
-            "pdf": None,
-        }
-
-        # Render PDF if requested
-        if generate_pdf:
-            pdf_path = output_dir / f"{base_name}.pdf"
-            if render_preview_pdf(html_content, pdf_path):
-                result["pdf"] = str(pdf_path)
-            else:
-                result["pdf_error"] = "weasyprint not installed"
-
-        generated.append(result)
-
-    return generated
+    if incremental:
+        _save_render_cache(output_dir, cache)
+    return [results[index] for index in range(len(loaded))]
 
 
 def main() -> None:
@@ -359,6 +514,17 @@ def main() -> None:
         action="store_true",
         help="Skip PDF generation (HTML only)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Render cards in N worker processes (output unchanged)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip cards unchanged since they last rendered their outputs",
+    )
     parser.add_argument(
         "--single",
         type=Path,
@@ -371,12 +537,12 @@ def main() -> None:
         if not args.single.exists():
             raise SystemExit(f"File not found: {args.single}")
 
-        card = json.loads(args.single.read_text())
+        card = orjson.loads(args.single.read_bytes())
         html_content = render_preview_html(card)
 
         args.out.mkdir(parents=True, exist_ok=True)
         html_path = args.out / f"{args.single.stem}.html"
-        html_path.write_text(html_content)
+        html_path.write_bytes(html_content.encode("utf-8"))
         print(f"HTML: {html_path}")
 
         if not args.no_pdf:
@@ -395,6 +561,8 @@ def main() -> None:
             args.stake_cards,
             args.out,
             generate_pdf=not args.no_pdf,
+            workers=args.workers,
+            incremental=args.incremental,
         )
 
         print(f"Rendered {len(results)} preview(s) to {args.out}")
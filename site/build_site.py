@@ -8,12 +8,15 @@ Lite ordering remains unchanged.
 """
 
 import argparse
-import json
 import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import List
 
+from turf.jsonio import loads_json
 from turf.race_summary import summarize_race
 from turf.value import derive_runner_value_fields
 
@@ -22,7 +25,7 @@ HEADER_TEMPLATE = Path(__file__).resolve().parent / "templates" / "header.html"
 FOOTER_TEMPLATE = Path(__file__).resolve().parent / "templates" / "footer.html"
 
 
-@dataclass
+@dataclass(slots=True)
 class RunnerView:
     runner_number: int
     runner_name: str
@@ -40,7 +43,7 @@ class RunnerView:
     risk_profile: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class RaceView:
     meeting_id: str
     meeting_label: str
@@ -55,17 +58,18 @@ class RaceView:
 
     @property
     def top_runner(self) -> RunnerView:
-        return sorted(
+        # min() returns the first smallest key, i.e. what sorted(...)[0] picked, in one pass.
+        return min(
             self.runners,
             key=lambda r: (
                 -(r.win_prob if r.win_prob is not None else r.lite_score),
                 -(r.lite_score),
                 r.runner_number,
             ),
-        )[0]
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class SiteView:
     races: List[RaceView]
 
@@ -75,6 +79,7 @@ LITE_TAG_COLORS = {
     "B_LITE": "badge-b",
     "PASS_LITE": "badge-pass",
 }
+_BADGE_HTML = {tag: f"<span class=\"badge {css}\">{tag}</span>" for tag, css in LITE_TAG_COLORS.items()}
 
 
 def valid_price(price: float | None) -> bool:
@@ -94,6 +99,7 @@ def kelly_units(win_prob: float | None, price: float | None, *, fraction: float
     return min(cap, round(stake_fraction * 10, 2))
 
 
+@lru_cache(maxsize=None)
 def load_templates() -> tuple[str, str]:
     header = HEADER_TEMPLATE.read_text(encoding="utf-8")
     footer = FOOTER_TEMPLATE.read_text(encoding="utf-8")
@@ -105,8 +111,11 @@ def apply_header(template: str, *, title: str, prefix: str) -> str:
 
 
 def render_badge(tag: str) -> str:
-    css = LITE_TAG_COLORS.get(tag, "badge-pass")
-    return f"<span class=\"badge {css}\">{tag}</span>"
+    badge = _BADGE_HTML.get(tag)
+    if badge is None:
+        # Unknown tags keep their own text with the PASS styling.
+        badge = f"<span class=\"badge badge-pass\">{tag}</span>"
+    return badge
 
 
 def render_runner_row(runner: RunnerView) -> str:
@@ -119,67 +128,49 @@ def render_runner_row(runner: RunnerView) -> str:
     ev_marker = runner.ev_marker or ""
     band = runner.ev_band or ""
     risk = runner.risk_profile or ""
-    return """
+    # f-strings compile to direct string building; str.format() re-parsed this template per row.
+    return f"""
     <tr>
-      <td class="num">{runner_number}</td>
-      <td>{name}</td>
-      <td>{badge}</td>
-      <td class="num">{lite_score:.3f}</td>
-      <td class="num">{price}</td>
-      <td class="num">{win}</td>
-      <td class="num">{place}</td>
-      <td class="num">{edge}</td>
-      <td class="num">{ev}</td>
+      <td class="num">{runner.runner_number}</td>
+      <td>{runner.runner_name}</td>
+      <td>{render_badge(runner.lite_tag)}</td>
+      <td class="num">{runner.lite_score:.3f}</td>
+      <td class="num">{price_text}</td>
+      <td class="num">{win_text}</td>
+      <td class="num">{place_text}</td>
+      <td class="num">{edge_text}</td>
+      <td class="num">{ev_text}</td>
       <td class="num">{ev_marker}</td>
       <td class="num">{band}</td>
       <td class="num">{risk}</td>
       <td class="num">{units}</td>
     </tr>
-    """.format(
-        runner_number=runner.runner_number,
-        name=runner.runner_name,
-        badge=render_badge(runner.lite_tag),
-        lite_score=runner.lite_score,
-        price=price_text,
-        win=win_text,
-        place=place_text,
-        edge=edge_text,
-        ev=ev_text,
-        ev_marker=ev_marker,
-        band=band,
-        risk=risk,
-        units=units,
-    )
+    """
 
 
 def render_race_page(race: RaceView, header: str, footer: str) -> str:
-    body_rows = "\n".join(render_runner_row(r) for r in race.runners)
+    body_rows = "\n".join([render_runner_row(r) for r in race.runners])
     warnings = ", ".join(race.warnings) if race.warnings else "None"
     title = f"{race.meeting_label} R{race.race_number}"
     page_header = apply_header(header, title=title, prefix="../")
     summary = race.race_summary
     if summary:
-        summary_block = """
+        summary_block = f"""
     <section class="race-summary">
       <h2>Race summary</h2>
       <ul>
-        <li><strong>Top picks:</strong> {top_picks}</li>
-        <li><strong>Value picks:</strong> {value_picks}</li>
-        <li><strong>Fades:</strong> {fades}</li>
-        <li><strong>Trap race:</strong> {trap_race}</li>
-        <li><strong>Strategy:</strong> {strategy}</li>
+        <li><strong>Top picks:</strong> {summary.get('top_picks', [])}</li>
+        <li><strong>Value picks:</strong> {summary.get('value_picks', [])}</li>
+        <li><strong>Fades:</strong> {summary.get('fades', [])}</li>
+        <li><strong>Trap race:</strong> {summary.get('trap_race', False)}</li>
+        <li><strong>Strategy:</strong> {summary.get('strategy', '')}</li>
       </ul>
     </section>
-    """.format(
-            top_picks=summary.get("top_picks", []),
-            value_picks=summary.get("value_picks", []),
-            fades=summary.get("fades", []),
-            trap_race=summary.get("trap_race", False),
-            strategy=summary.get("strategy", ""),
-        )
+    """
     else:
         summary_block = ""
-    return page_header + f"""
+    # Header and footer are interpolated so the page is built in one pass, not via `+` temporaries.
+    return f"""{page_header}
   <main>
     <h1>{race.meeting_label} — Race {race.race_number}</h1>
     <p class="meta">Date: {race.date_local} · Distance: {race.distance_m or '—'}m · Degrade mode: {race.degrade_mode} · Warnings: {warnings}</p>
@@ -194,7 +185,7 @@ def render_race_page(race: RaceView, header: str, footer: str) -> str:
       </tbody>
     </table>
   </main>
-""" + footer
+{footer}"""
 
 
 def render_index(site: SiteView, header: str, footer: str) -> str:
@@ -204,31 +195,22 @@ def render_index(site: SiteView, header: str, footer: str) -> str:
         win_text = f"{runner.win_prob:.2%}" if runner.win_prob is not None else "—"
         link = f"races/{race.meeting_id}_R{race.race_number}.html"
         rows.append(
-            """
+            f"""
         <tr>
-          <td>{date}</td>
-          <td>{meeting}</td>
-          <td class="num">{race_number}</td>
-          <td>{runner_name}</td>
-          <td>{badge}</td>
-          <td class="num">{lite_score:.3f}</td>
-          <td class="num">{win}</td>
+          <td>{race.date_local}</td>
+          <td>{race.meeting_label}</td>
+          <td class="num">{race.race_number}</td>
+          <td>{runner.runner_name}</td>
+          <td>{render_badge(runner.lite_tag)}</td>
+          <td class="num">{runner.lite_score:.3f}</td>
+          <td class="num">{win_text}</td>
           <td class="num"><a href="{link}">View</a></td>
         </tr>
-        """.format(
-                date=race.date_local,
-                meeting=race.meeting_label,
-                race_number=race.race_number,
-                runner_name=runner.runner_name,
-                badge=render_badge(runner.lite_tag),
-                lite_score=runner.lite_score,
-                win=win_text,
-                link=link,
-            )
+        """
         )
     rows_html = "\n".join(rows)
     page_header = apply_header(header, title="Stake cards", prefix="")
-    return page_header + f"""
+    return f"""{page_header}
   <main>
     <h1>TURF ENGINE LITE — Daily stake cards</h1>
     <p class="meta">Overlay fields are display-only; ordering remains LiteScore + tie-gate.</p>
@@ -239,7 +221,7 @@ def render_index(site: SiteView, header: str, footer: str) -> str:
       </tbody>
     </table>
   </main>
-""" + footer
+{footer}"""
 
 
 VALUE_FIELDS = [
@@ -277,11 +259,12 @@ def parse_runner(runner: dict, *, derive_on_render: bool = False) -> RunnerView:
 
 
 def parse_stake_card(path: Path, *, derive_on_render: bool) -> List[RaceView]:
-    payload = json.loads(path.read_text())
+    payload = loads_json(path.read_bytes())
     meeting = payload.get("meeting", {})
     meeting_id = meeting.get("meeting_id", "UNKNOWN_MEETING")
     meeting_label = f"{meeting.get('track_canonical', meeting_id)} ({meeting_id})"
     date_local = meeting.get("date_local", "")
+    engine_context = payload.get("engine_context", {})
     races = []
     for race in payload.get("races", []):
         runners = [parse_runner(r, derive_on_render=derive_on_render) for r in race.get("runners", [])]
@@ -296,8 +279,8 @@ def parse_stake_card(path: Path, *, derive_on_render: bool) -> List[RaceView]:
                 date_local=date_local,
                 race_number=race.get("race_number"),
                 distance_m=race.get("distance_m"),
-                degrade_mode=payload.get("engine_context", {}).get("degrade_mode", "UNKNOWN"),
-                warnings=payload.get("engine_context", {}).get("warnings", []),
+                degrade_mode=engine_context.get("degrade_mode", "UNKNOWN"),
+                warnings=engine_context.get("warnings", []),
                 runners=runners,
                 artifact_name=path.name,
                 race_summary=race_summary,
@@ -306,31 +289,55 @@ def parse_stake_card(path: Path, *, derive_on_render: bool) -> List[RaceView]:
     return races
 
 
+@lru_cache(maxsize=None)
+def load_static_css() -> str:
+    return STYLE_PATH.read_text(encoding="utf-8")
+
+
 def copy_static(out_dir: Path) -> None:
     static_dir = out_dir / "static"
     static_dir.mkdir(parents=True, exist_ok=True)
-    static_css = STYLE_PATH.read_text(encoding="utf-8")
+    static_css = load_static_css()
     (static_dir / "styles.css").write_text(static_css, encoding="utf-8")
 
 
-def build_site(stake_dir: Path, out_dir: Path, *, derive_on_render: bool = False) -> None:
+def _build_card_pages(path: Path, *, derive_on_render: bool, header: str, footer: str) -> tuple[List[RaceView], List[str]]:
+    races = parse_stake_card(path, derive_on_render=derive_on_render)
+    return races, [render_race_page(race, header, footer) for race in races]
+
+
+def build_site(stake_dir: Path, out_dir: Path, *, derive_on_render: bool = False, workers: int = 1) -> None:
     stake_files = sorted(stake_dir.glob("*.json"))
     if not stake_files:
         raise SystemExit(f"No stake cards found in {stake_dir}")
 
+    header, footer = load_templates()
+    build_card = partial(_build_card_pages, derive_on_render=derive_on_render, header=header, footer=footer)
+    # Cards are parsed and rendered independently; pages are written below in card order,
+    # so a pool cannot change output. This module is usually loaded from its file path
+    # (render-site, tests), which spawned workers cannot import, so the pool needs fork;
+    # without it the build stays serial.
+    if workers > 1 and len(stake_files) > 1 and "fork" in multiprocessing.get_all_start_methods():
+        workers = min(workers, len(stake_files))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as pool:
+            built = list(pool.map(build_card, stake_files, chunksize=max(1, len(stake_files) // (4 * workers))))
+    else:
+        built = [build_card(path) for path in stake_files]
+
     races: List[RaceView] = []
-    for path in stake_files:
-        races.extend(parse_stake_card(path, derive_on_render=derive_on_render))
+    pages: List[str] = []
+    for card_races, card_pages in built:
+        races.extend(card_races)
+        pages.extend(card_pages)
 
     site = SiteView(races=races)
-    header, footer = load_templates()
 
     out_dir.mkdir(parents=True, exist_ok=True)
     races_dir = out_dir / "races"
     races_dir.mkdir(exist_ok=True)
 
-    for race in site.races:
-        page_html = render_race_page(race, header, footer)
+    # Races from different cards can share a page name; the later card wins, as before.
+    for race, page_html in zip(site.races, pages):
         race_path = races_dir / f"{race.meeting_id}_R{race.race_number}.html"
         race_path.write_text(page_html, encoding="utf-8")
 
@@ -349,9 +356,10 @@ def main() -> None:
         action="store_true",
         help="Optionally derive EV/race summaries during rendering (default: off)",
     )
+    parser.add_argument("--workers", type=int, default=1, help="Parse and render stake cards in N worker processes (output unchanged)")
     args = parser.parse_args()
 
-    build_site(args.stake_cards, args.out, derive_on_render=args.derive_on_render)
+    build_site(args.stake_cards, args.out, derive_on_render=args.derive_on_render, workers=args.workers)
 
 
 if __name__ == "__main__":
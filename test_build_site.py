@@ -139,3 +139,20 @@ def test_build_site_can_optionally_derive(tmp_path: Path):
 
     assert "Race summary" in race_html
     assert "🟢" in race_html
+
+
+def test_build_site_workers_match_serial(tmp_path: Path):
+    stake_path = _build_minimal_stake_card(tmp_path)
+    payload = json.loads(stake_path.read_text())
+    payload["races"][0]["runners"][0]["runner_name"] = "Runner Z"
+    # Same meeting and race as the first card, so it overwrites the same page.
+    (stake_path.parent / "stake_card_late.json").write_text(json.dumps(payload))
+
+    build_site = load_build_site().build_site
+    build_site(stake_path.parent, tmp_path / "serial")
+    build_site(stake_path.parent, tmp_path / "pooled", workers=2)
+
+    serial_html = (tmp_path / "serial" / "races" / "DEMO_R1.html").read_text()
+    assert "Runner Z" in serial_html
+    assert (tmp_path / "pooled" / "races" / "DEMO_R1.html").read_text() == serial_html
+    assert (tmp_path / "pooled" / "index.html").read_text() == (tmp_path / "serial" / "index.html").read_text()
@@ -72,3 +72,25 @@ def test_overlay_from_stake_card_defaults(tmp_path: Path):
 
     applied = apply_pro_overlay_to_stake_card(stake_card, runner_vector, forecasts)
     assert applied["engine_context"]["forecast_params"]["tau"] == 0.12
+
+
+def test_apply_overlay_leaves_input_card_untouched():
+    runner_rows = [
+        RunnerInput(1, "One", 1, 3.0, "MID", 17.1),
+        RunnerInput(2, "Two", 4, 4.4, "ON_PACE", 17.3),
+        RunnerInput(3, "Three", 7, 7.5, "BACK", 17.0),
+    ]
+    meeting = {"meeting_id": "DEMO3", "track_canonical": "RANDWICK", "date_local": "2025-12-15"}
+    race = {"race_number": 1, "distance_m": 1200}
+    stake_card, _ = compile_stake_card(meeting=meeting, race=race, runner_rows=runner_rows, captured_at="TS")
+    before = json.dumps(stake_card, sort_keys=True)
+
+    runner_vector, forecasts = overlay_from_stake_card(stake_card)
+    applied = apply_pro_overlay_to_stake_card(
+        stake_card, runner_vector, forecasts, feature_flags={"ev_bands": True, "race_summary": True}
+    )
+
+    assert json.dumps(stake_card, sort_keys=True) == before
+    assert applied["engine_context"]["debug"]["overlay_writer"] == "PRO_OVERLAY_LOGIT_WIN_PLACE_V0"
+    assert stake_card["engine_context"]["debug"]["overlay_writer"] == "LITE_WRAPPER_SOFTMAX_BLEND"
+    assert "race_summary" in applied["races"][0] and "race_summary" not in stake_card["races"][0]
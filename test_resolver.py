@@ -1,9 +1,12 @@
 import json
+from functools import lru_cache
 from turf.models import TrackRegistry
 from turf.resolver import resolve_tracks
 
+@lru_cache(maxsize=None)
 def load_seed():
-    with open('data/nsw_seed.json','r') as f:
+    # Parsed once per session; resolve_tracks only reads the registry.
+    with open('data/nsw_seed.json','rb') as f:
         return TrackRegistry.model_validate_json(f.read())
 
 def test_resolve_exact():
@@ -105,3 +105,55 @@ def test_no_bets_is_safe(tmp_path: Path):
     assert summary["counts"]["bets_simulated"] == 0
     assert summary["results"]["mean_final"] == 100.0
 
+
+def test_sha256_file_matches_in_memory_digest(tmp_path: Path):
+    import hashlib
+
+    card_path = tmp_path / "stake_card.json"
+    data = json.dumps(_minimal_card()).encode() * 5000  # spans several read chunks
+    card_path.write_bytes(data)
+
+    assert sha256_file(card_path) == hashlib.sha256(data).hexdigest()
+
+
+def test_simulation_matches_stake_for_bet_reference():
+    import random
+    import statistics
+
+    from turf.simulation import Bet, stake_for_bet
+
+    bets = [
+        Bet("M", "2025-12-15", 1, n, odds, prob, None, None)
+        for n, (odds, prob) in enumerate([(2.0, 0.55), (None, 0.4), (1.0, 0.9), (6.5, 0.2), (3.2, None), (4.0, 0.3)])
+    ]
+    for policy in ("flat", "kelly", "fractional_kelly", "unknown"):
+        params = dict(bankroll_start=500.0, policy=policy, flat_stake=20.0, kelly_fraction=0.25, max_stake_frac=0.05)
+
+        rng = random.Random(11)
+        finals, simulated, skipped = [], 0, 0
+        for _ in range(300):
+            bankroll = params["bankroll_start"]
+            for bet in bets:
+                stake = stake_for_bet(
+                    policy=policy,
+                    bankroll=bankroll,
+                    win_prob=bet.win_prob,
+                    odds_dec=bet.odds_dec,
+                    flat_stake=params["flat_stake"],
+                    kelly_fraction=params["kelly_fraction"],
+                    max_stake_frac=params["max_stake_frac"],
+                )
+                if stake <= 0 or not bet.has_price_prob:
+                    skipped += 1
+                    continue
+                simulated += 1
+                bankroll -= stake
+                if rng.random() < bet.win_prob:
+                    bankroll += stake * bet.odds_dec
+            finals.append(round(bankroll, 2))
+
+        summary = simulate_bankroll(bets=bets, iters=300, seed=11, **params)
+        assert summary["counts"] == {"bets_considered": 6, "bets_simulated": simulated, "bets_skipped_missing": skipped}
+        assert summary["results"]["min_final"] == min(finals)
+        assert summary["results"]["max_final"] == max(finals)
+        assert summary["results"]["median_final"] == statistics.median(finals)
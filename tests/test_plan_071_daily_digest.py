@@ -96,3 +96,30 @@ def test_plan071_prefer_pro_dedupes(tmp_path: Path) -> None:
     # With prefer_pro=False we select the non-pro card; EV<=0 should yield 0 bets
     assert daily_lite["meetings"][0]["bets_count"] == 0
 
+
+def test_plan071_workers_match_serial(tmp_path: Path) -> None:
+    cards = tmp_path / "cards"
+    cards.mkdir()
+    for i, date_local in enumerate(("2025-12-17", "2025-12-18", "2025-12-19")):
+        _write(cards / f"stake_card_{i}.json", _stake_card(f"M{i}", date_local, 0.10))
+
+    serial = build_daily_digest(
+        stake_cards_dir=cards,
+        out_dir=tmp_path / "serial",
+        prefer_pro=False,
+        write_per_meeting=True,
+        simulate=True,
+        iters=200,
+    )
+    pooled = build_daily_digest(
+        stake_cards_dir=cards,
+        out_dir=tmp_path / "pooled",
+        prefer_pro=False,
+        write_per_meeting=True,
+        simulate=True,
+        iters=200,
+        workers=2,
+    )
+
+    assert serial["meetings"] == pooled["meetings"]
+    assert (tmp_path / "serial" / "daily_digest.md").read_text() == (tmp_path / "pooled" / "daily_digest.md").read_text()
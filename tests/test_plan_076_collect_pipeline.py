@@ -23,8 +23,9 @@ from turf.collect_pipeline import (
     process_meeting,
     process_race,
     run_pipeline,
+    write_meeting_stake_cards,
 )
-from turf.odds_collect import FixtureAdapter, get_odds_adapter
+from turf.odds_collect import FixtureAdapter, OddsSnapshot, capture_odds_snapshot, get_odds_adapter
 from turf.ra_collect import (
     RaceCapture,
     capture_meeting,
@@ -157,6 +158,20 @@ class TestOddsCollect:
         fixture_adapter = get_odds_adapter("fixture", fixtures_dir=ODDS_FIXTURES)
         assert fixture_adapter.source_name == "fixture"
 
+    def test_captured_odds_escape_non_ascii(self, tmp_path: Path) -> None:
+        """Captured odds are written with stdlib json escapes, as before orjson."""
+        snapshot = OddsSnapshot(
+            meeting_id=TEST_MEETING,
+            race_number=1,
+            date_local=TEST_DATE,
+            source="fixture",
+            runners=[{"runner_number": 1, "runner_name": "O\u2019Brien Lass", "price_now_dec": 3.5}],
+            captured_at="2025-12-18T10:00:00+11:00",
+        )
+        raw = capture_odds_snapshot(snapshot, tmp_path).read_bytes()
+        assert b'"O\\u2019Brien Lass"' in raw
+        assert raw == json.dumps(json.loads(raw), indent=2).encode("ascii")
+
 
 # ---------------------------------------------------------------------------
 # Pipeline tests
@@ -208,6 +223,23 @@ class TestCollectPipeline:
         assert meeting_artifacts.meeting_id == TEST_MEETING
         assert len(meeting_artifacts.races) == 2
 
+    def test_stake_cards_escape_non_ascii(self, tmp_path: Path) -> None:
+        """Lite and PRO stake cards keep stdlib json escapes for non-ASCII names."""
+        capture = load_captured_meeting(RA_FIXTURES, TEST_DATE, TEST_MEETING)
+        assert capture is not None
+
+        meeting_artifacts = process_meeting(capture, get_odds_adapter("none"), apply_pro=True)
+        for race in meeting_artifacts.races:
+            for card in (race.stake_card, race.stake_card_pro):
+                card["races"][0]["runners"][0]["runner_name"] = "O\u2019Brien Lass"
+
+        written = write_meeting_stake_cards(meeting_artifacts, tmp_path)
+        assert len(written) == 4
+        for path in written:
+            raw = path.read_bytes()
+            assert b'"O\\u2019Brien Lass"' in raw
+            assert raw == json.dumps(json.loads(raw), indent=2).encode("ascii")
+
     def test_pipeline_determinism(self, tmp_path: Path) -> None:
         """Test that the pipeline produces identical output on repeated runs."""
         # Copy fixtures to tmp_path to use as capture_dir
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from cli import turf_cli
+from turf import cli as turf_registry_cli
+
+
+def test_plan080_cli_import_does_not_load_engine() -> None:
+    code = "import sys, cli.turf_cli; print(any(m.startswith(('engine', 'turf')) for m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_plan080_version_fast_path(monkeypatch, capsys) -> None:
+    monkeypatch.setattr(sys, "argv", ["turf", "--version"])
+    turf_cli.main()
+    assert capsys.readouterr().out.startswith("turf ")
+
+
+def test_plan080_module_version_skips_typer() -> None:
+    from cli._version import package_version
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "cli.turf_cli", "--version"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout == f"turf {package_version()}\n"
+    imported = {line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines() if "|" in line}
+    assert "typer" not in imported
+    assert not any(name.split(".")[0] in ("turf", "engine") for name in imported)
+
+
+def test_plan080_registry_cache_keyed_on_file_state(tmp_path: Path) -> None:
+    registry = tmp_path / "registry.json"
+    shutil.copyfile("data/nsw_seed.json", registry)
+
+    first = turf_registry_cli._load_registry(str(registry))
+    assert turf_registry_cli._load_registry(str(registry)) is first
+
+    st = os.stat(registry)
+    os.utime(registry, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    reloaded = turf_registry_cli._load_registry(str(registry))
+    assert reloaded is not first
+    assert reloaded == first
+
+
+def test_plan080_site_builder_loaded_once() -> None:
+    module = turf_cli._load_site_builder()
+    assert turf_cli._load_site_builder() is module
+    assert callable(module.build_site)
+
+
+def test_plan080_card_cache_keyed_on_file_state(tmp_path: Path) -> None:
+    from turf.jsonio import load_json_cached
+
+    card = tmp_path / "stake_card.json"
+    card.write_text('{"races": []}')
+
+    first = load_json_cached(card)
+    assert load_json_cached(card) is first
+
+    card.write_text('{"races": [{"race_number": 1}]}')
+    assert load_json_cached(card) == {"races": [{"race_number": 1}]}
+
+
+def test_plan080_demo_artifacts_parse_cached_dicts_fresh() -> None:
+    from turf import demo_pipeline
+
+    market, speed, odds = demo_pipeline.load_demo_artifacts("2025-12-15")
+    market["runners"][0]["odds_minimal"]["price_now_dec"] = -1.0
+
+    again, _, _ = demo_pipeline.load_demo_artifacts("2025-12-15")
+    assert again["runners"][0]["odds_minimal"]["price_now_dec"] != -1.0
+    assert demo_pipeline._parse_meeting_fixture.cache_info().hits >= 1
+    assert demo_pipeline.load_demo_artifacts("2025-12-16")[0]["meeting"]["meeting_id"] == "DEMO_2025-12-16"
+
+
+def test_plan080_write_json_is_atomic(tmp_path: Path, monkeypatch) -> None:
+    from turf import jsonio
+
+    target = tmp_path / "stake_card.json"
+    jsonio.write_json_atomic(target, {"races": []})
+
+    def fail_replace(src, dst):
+        raise OSError("interrupted")
+
+    monkeypatch.setattr(jsonio.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        jsonio.write_json_atomic(target, {"races": [{"race_number": 1}]})
+    assert target.read_bytes() == b'{\n  "races": []\n}'
+    assert [p.name for p in tmp_path.iterdir()] == ["stake_card.json"]
+
+
+def test_plan080_json_writes_match_stdlib_encoding(tmp_path: Path) -> None:
+    from turf import jsonio
+
+    target = tmp_path / "card.json"
+    jsonio.write_json_atomic(target, {"runner_name": "O\u2019Brien Lass", "edge": 1e-05, "ev": float("nan")})
+    assert target.read_bytes() == b'{\n  "runner_name": "O\\u2019Brien Lass",\n  "edge": 1e-05,\n  "ev": NaN\n}'
+
+
+def test_plan080_non_ascii_runner_name_written_escaped(tmp_path: Path) -> None:
+    from typer.testing import CliRunner
+
+    runner = CliRunner()
+    cards = tmp_path / "cards"
+    result = runner.invoke(turf_cli.app, ["demo-run", "--date", "2025-12-15", "--out", str(cards)])
+    assert result.exit_code == 0, result.output
+
+    card = json.loads((cards / "stake_card.json").read_text())
+    card["races"][0]["runners"][0]["runner_name"] = "O\u2019Brien Lass"
+    named = tmp_path / "named.json"
+    named.write_text(json.dumps(card, indent=2))
+    overlay, filtered = tmp_path / "overlay.json", tmp_path / "filtered.json"
+    result = runner.invoke(turf_cli.app, ["apply-overlay", "--stake-card-path", str(named), "--out", str(overlay)])
+    assert result.exit_code == 0, result.output
+    result = runner.invoke(
+        turf_cli.app, ["filter-value", "--stake-card", str(cards / "stake_card_pro.json"), "--out", str(filtered)]
+    )
+    assert result.exit_code == 0, result.output
+
+    assert b'"O\\u2019Brien Lass"' in overlay.read_bytes()
+    # ev_marker emoji are written as surrogate-pair escapes, as stdlib json does.
+    assert b"\\ud83d" in filtered.read_bytes()
+    for path in (overlay, filtered, cards / "stake_card_pro.json"):
+        raw = path.read_bytes()
+        assert raw == json.dumps(json.loads(raw), indent=2).encode("ascii")
+
+
+def test_plan080_demo_run_compact_runner_vector(tmp_path: Path) -> None:
+    from typer.testing import CliRunner
+
+    runner = CliRunner()
+    pretty, compact = tmp_path / "pretty", tmp_path / "compact"
+    for out, extra in ((pretty, []), (compact, ["--compact"])):
+        result = runner.invoke(turf_cli.app, ["demo-run", "--date", "2025-12-15", "--out", str(out), *extra])
+        assert result.exit_code == 0, result.output
+
+    compact_bytes = (compact / "runner_vector.json").read_bytes()
+    assert b"\n" not in compact_bytes
+    assert json.loads(compact_bytes) == json.loads((pretty / "runner_vector.json").read_bytes())
+    assert (compact / "stake_card_pro.json").read_bytes() == (pretty / "stake_card_pro.json").read_bytes()
+
+
+def test_plan080_commands_registered_once() -> None:
+    names = [cmd.name or cmd.callback.__name__ for cmd in turf_cli.app.registered_commands]
+    assert len(names) == len(set(names))
@@ -0,0 +1,239 @@
+"""Plan 083: odds_watch polling, revalidation and concurrent targets."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("lxml")
+
+_SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "odds_watch.py"
+
+ODDS_PAGE = (
+    b"<html><body><table class='odds'>"
+    b"<tr><th>No.</th><th>Price</th></tr>"
+    b"<tr><td>1. Alpha</td><td>$3.50</td></tr>"
+    b"<tr><td>2. Beta</td><td>4.20</td></tr>"
+    b"</table></body></html>"
+)
+
+
+def _load_odds_watch():
+    spec = importlib.util.spec_from_file_location("odds_watch", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _target(url: str, meeting_id: str, race_number: int, output_file: Path) -> dict:
+    return {"url": url, "meeting_id": meeting_id, "race_number": race_number, "output_file": output_file}
+
+
+def _read_log(path: Path) -> list:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_plan083_targets_share_one_log(tmp_path: Path):
+    ow = _load_odds_watch()
+    log_path = tmp_path / "odds.jsonl"
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=ODDS_PAGE))
+    targets = [
+        _target("https://odds.example/r1", "RANDWICK", 1, log_path),
+        _target("https://odds.example/r2", "RANDWICK", 2, log_path),
+    ]
+
+    # One poll each: the next slot (60s) is past the end of the watch.
+    results = asyncio.run(
+        ow.watch_many_async(targets, interval_seconds=60, duration_minutes=0.01, verbose=False, transport=transport)
+    )
+
+    assert [len(snapshots) for snapshots in results] == [1, 1]
+    records = _read_log(log_path)
+    assert sorted(record["race_number"] for record in records) == [1, 2]
+    for record in records:
+        assert record["status_code"] == 200
+        assert record["odds"] == [{"runner_number": 1, "price": 3.5}, {"runner_number": 2, "price": 4.2}]
+
+
+def test_plan083_requests_capped_per_host(tmp_path: Path):
+    ow = _load_odds_watch()
+    in_flight: dict = {}
+    peak: dict = {}
+
+    async def handler(request):
+        host = request.url.host
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.02)
+        in_flight[host] -= 1
+        return httpx.Response(200, content=ODDS_PAGE)
+
+    targets = [_target(f"https://a.example/r{n}", "A", n, tmp_path / "a.jsonl") for n in range(1, 6)]
+    targets += [_target(f"https://b.example/r{n}", "B", n, tmp_path / "b.jsonl") for n in range(1, 3)]
+
+    asyncio.run(
+        ow.watch_many_async(
+            targets,
+            interval_seconds=60,
+            duration_minutes=0.01,
+            verbose=False,
+            max_per_host=2,
+            transport=httpx.MockTransport(handler),
+        )
+    )
+
+    assert peak == {"a.example": 2, "b.example": 2}
+    assert len(_read_log(tmp_path / "a.jsonl")) == 5
+
+
+def test_plan083_watch_stops_at_deadline(tmp_path: Path):
+    ow = _load_odds_watch()
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=ODDS_PAGE))
+    targets = [_target("https://odds.example/r1", "RANDWICK", 1, tmp_path / "odds.jsonl")]
+
+    started = time.monotonic()
+    (snapshots,) = asyncio.run(
+        ow.watch_many_async(targets, interval_seconds=0.05, duration_minutes=0.005, verbose=False, transport=transport)
+    )
+    elapsed = time.monotonic() - started
+
+    # 0.3s watch on a 0.05s grid: polls at 0.00 .. 0.25, none scheduled at or after the end.
+    assert 2 <= len(snapshots) <= 6
+    assert elapsed < 1.0
+    assert len(_read_log(tmp_path / "odds.jsonl")) == len(snapshots)
+
+
+def test_plan083_load_targets_defaults_output(tmp_path: Path):
+    ow = _load_odds_watch()
+    targets_file = tmp_path / "targets.json"
+    targets_file.write_text(
+        json.dumps(
+            [
+                {"url": "https://odds.example/r1", "meeting_id": "RANDWICK", "race": "1"},
+                {"url": "https://odds.example/r2", "meeting_id": "RANDWICK", "race": 2, "out": "r2.jsonl"},
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+    targets = ow.load_targets(targets_file, tmp_path / "default.jsonl")
+
+    assert targets == [
+        _target("https://odds.example/r1", "RANDWICK", 1, tmp_path / "default.jsonl"),
+        _target("https://odds.example/r2", "RANDWICK", 2, Path("r2.jsonl")),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("status_code", "response_etag", "etag", "expected"),
+    [
+        (200, '"v2"', '"v1"', '"v2"'),
+        (200, None, '"v1"', None),
+        (304, None, '"v1"', '"v1"'),
+        (304, '"v2"', '"v1"', '"v2"'),
+        (503, '"v2"', '"v1"', None),
+    ],
+)
+def test_plan083_next_etag(status_code, response_etag, etag, expected):
+    ow = _load_odds_watch()
+    assert ow._next_etag(status_code, response_etag, etag) == expected
+
+
+def test_plan083_not_modified_reuses_previous_odds():
+    ow = _load_odds_watch()
+    url = "https://odds.example/r1"
+    first = ow.build_poll_snapshot(url, "RANDWICK", 1, ODDS_PAGE, 200, encoding="utf-8", timestamp="t0")
+
+    second = ow.build_poll_snapshot(url, "RANDWICK", 1, b"", 304, previous=first, timestamp="t1")
+
+    assert second["status_code"] == 304
+    assert second["timestamp"] == "t1"
+    assert second["odds"] == first["odds"]
+    assert second["html_hash"] == first["html_hash"]
+    assert second["runner_count"] == 2
+
+
+def test_plan083_unchanged_page_skips_parse(monkeypatch):
+    ow = _load_odds_watch()
+    url = "https://odds.example/r1"
+    first = ow.build_poll_snapshot(url, "RANDWICK", 1, ODDS_PAGE, 200, encoding="utf-8")
+
+    def _no_parse(*args, **kwargs):
+        raise AssertionError("unchanged page was parsed again")
+
+    monkeypatch.setattr(ow, "parse_odds_simple", _no_parse)
+    second = ow.build_poll_snapshot(url, "RANDWICK", 1, ODDS_PAGE, 200, previous=first, encoding="utf-8")
+
+    assert second["html_hash"] == first["html_hash"]
+    assert second["odds"] == first["odds"]
+
+
+@pytest.mark.parametrize(
+    ("deadline", "now", "expected"),
+    [
+        # On time: the next slot on the grid.
+        (0.0, 10.0, 60.0),
+        # Fetch ran past one slot: the missed slot is kept, so the next poll fires at once.
+        (0.0, 70.0, 60.0),
+        # Several slots missed: skip them instead of bursting catch-up polls.
+        (0.0, 200.0, 180.0),
+        (60.0, 185.0, 180.0),
+    ],
+)
+def test_plan083_next_deadline(deadline, now, expected):
+    ow = _load_odds_watch()
+    assert ow._next_deadline(deadline, 60, now) == expected
+
+
+def test_plan083_parse_skips_non_numeric_rows():
+    ow = _load_odds_watch()
+    page = (
+        b"<table class='runner'>"
+        b"<tr><td>Runner</td><td>Price</td></tr>"
+        b"<tr><td>Scratched</td><td>-</td></tr>"
+        b"<tr><td>3. Gamma</td><td>SCR</td></tr>"
+        b"<tr><td>4. Delta</td><td>$12.00</td></tr>"
+        b"<tr><td></td><td>5.00</td></tr>"
+        b"</table>"
+    )
+
+    assert ow.parse_odds_simple(page, "utf-8") == [{"runner_number": 4, "price": 12.0}]
+
+
+def test_plan083_watch_odds_uses_shared_loop(tmp_path: Path):
+    ow = _load_odds_watch()
+    seen_etags = []
+
+    def handler(request):
+        seen_etags.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=ODDS_PAGE, headers={"ETag": '"v1"'})
+
+    log_path = tmp_path / "odds.jsonl"
+    snapshots = ow.watch_odds(
+        "https://odds.example/r1",
+        "RANDWICK",
+        1,
+        log_path,
+        interval_seconds=0.05,
+        duration_minutes=0.002,
+        verbose=False,
+        transport=httpx.MockTransport(handler),
+    )
+
+    records = _read_log(log_path)
+    assert records == list(snapshots)
+    assert len(records) >= 2
+    assert seen_etags[:2] == [None, '"v1"']
+    assert [record["status_code"] for record in records[:2]] == [200, 304]
+    assert records[1]["odds"] == records[0]["odds"]
@@ -0,0 +1,104 @@
+"""Plan 084: render_previews incremental cache and worker pool."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import re
+import sys
+from pathlib import Path
+
+_SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "render_previews.py"
+_FOOTER = re.compile(r"Generated by TURF ENGINE LITE \| [^<\n]*")
+
+
+def _load_render_previews():
+    spec = importlib.util.spec_from_file_location("render_previews", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _card(meeting_id: str, date_local: str, price: float) -> dict:
+    return {
+        "meeting": {"meeting_id": meeting_id, "track_canonical": meeting_id.title(), "date_local": date_local},
+        "races": [
+            {
+                "race_number": 1,
+                "distance_m": 1200,
+                "runners": [
+                    {
+                        "runner_number": 1,
+                        "runner_name": "Runner A",
+                        "lite_score": 0.8,
+                        "lite_tag": "A_LITE",
+                        "odds_minimal": {"price_now_dec": price},
+                    },
+                    {
+                        "runner_number": 2,
+                        "runner_name": "Runner B",
+                        "lite_score": 0.6,
+                        "lite_tag": "B_LITE",
+                        "odds_minimal": {"price_now_dec": price + 2.0},
+                    },
+                ],
+            }
+        ],
+    }
+
+
+def _write_cards(cards_dir: Path) -> None:
+    cards_dir.mkdir()
+    cards = {
+        "a.json": _card("RANDWICK", "2025-12-18", 3.0),
+        "b.json": _card("ROSEHILL", "2025-12-18", 4.0),
+        "c.json": _card("FLEMINGTON", "2025-12-19", 5.0),
+        # Same (date, meeting) as a.json: both write one preview, the later card wins.
+        "d.json": _card("RANDWICK", "2025-12-18", 6.0),
+    }
+    for name, card in cards.items():
+        (cards_dir / name).write_text(json.dumps(card), encoding="utf-8")
+
+
+def _previews(output_dir: Path) -> dict:
+    return {path.name: _FOOTER.sub("", path.read_text(encoding="utf-8")) for path in output_dir.glob("*.html")}
+
+
+def test_plan084_incremental_skips_unchanged_cards(tmp_path: Path):
+    rp = _load_render_previews()
+    cards_dir = tmp_path / "cards"
+    output_dir = tmp_path / "previews"
+    _write_cards(cards_dir)
+
+    first = rp.render_previews(cards_dir, output_dir, generate_pdf=False, incremental=True)
+    assert (output_dir / rp.RENDER_CACHE_FILE).exists()
+
+    # Mark every preview: a skipped card leaves its file untouched.
+    for path in output_dir.glob("*.html"):
+        path.write_text("untouched", encoding="utf-8")
+    (cards_dir / "c.json").write_text(json.dumps(_card("FLEMINGTON", "2025-12-19", 9.0)), encoding="utf-8")
+
+    second = rp.render_previews(cards_dir, output_dir, generate_pdf=False, incremental=True)
+
+    assert second == first
+    assert (output_dir / "2025-12-18_RANDWICK.html").read_text(encoding="utf-8") == "untouched"
+    assert (output_dir / "2025-12-18_ROSEHILL.html").read_text(encoding="utf-8") == "untouched"
+    assert "9.00" in (output_dir / "2025-12-19_FLEMINGTON.html").read_text(encoding="utf-8")
+
+
+def test_plan084_workers_match_serial(tmp_path: Path):
+    rp = _load_render_previews()
+    cards_dir = tmp_path / "cards"
+    _write_cards(cards_dir)
+
+    serial = rp.render_previews(cards_dir, tmp_path / "serial", generate_pdf=False)
+    parallel = rp.render_previews(cards_dir, tmp_path / "parallel", generate_pdf=False, workers=2)
+
+    def _relative(results: list, output_dir: Path) -> list:
+        return [{**row, "html": Path(row["html"]).relative_to(output_dir).as_posix()} for row in results]
+
+    assert _relative(parallel, tmp_path / "parallel") == _relative(serial, tmp_path / "serial")
+    assert _previews(tmp_path / "parallel") == _previews(tmp_path / "serial")
+    assert len(_previews(tmp_path / "serial")) == 3
@@ -1,17 +1,18 @@
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 from typing import Iterable, List
 
+import orjson
+
 from tools.db_init_if_missing import init_db
 
 
 def load_stake_cards(stake_dir: Path) -> List[dict]:
     payloads: List[dict] = []
     for path in sorted(stake_dir.glob("*.json")):
-        payloads.append(json.loads(path.read_text()))
+        payloads.append(orjson.loads(path.read_bytes()))
     return payloads
 
 
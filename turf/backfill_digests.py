@@ -2,12 +2,12 @@ from __future__ import annotations
 
 """Deterministic digest backfill helper (derived-only)."""
 
-import json
+import os
 import shutil
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, List, Optional, Sequence
 from zoneinfo import ZoneInfo
 
 from engine.turf_engine_pro import (
@@ -15,16 +15,13 @@ from engine.turf_engine_pro import (
     build_runner_vector,
     pro_overlay_logit_win_place_v0,
 )
-from turf.compile_lite import RunnerInput, compile_stake_card, merge_odds_into_market
+from turf.compile_lite import compile_stake_card, merge_odds_into_market
 from turf.daily_digest import build_daily_digest
+from turf.demo_pipeline import load_demo_artifacts
 from turf.digest_pages import render_digest_pages
 from turf.feature_flags import resolve_feature_flags
-from turf.parse_odds import parse_generic_odds_table, parsed_odds_to_market
-from turf.parse_ra import (
-    parse_meeting_html,
-    parsed_race_to_market_snapshot,
-    parsed_race_to_speed_sidecar,
-)
+from turf.runner_join import build_engine_inputs, prepare_runner_tables
+from turf.jsonio import write_bytes_atomic, write_json_atomic
 
 
 AU_TZ = ZoneInfo("Australia/Sydney")
@@ -42,6 +39,8 @@ class BackfillConfig:
     seed: int = 1337
     write_per_meeting: bool = True
     render_html: bool = True
+    # Worker processes per day's digest; not recorded in the index because output is unchanged.
+    workers: int = 1
 
 
 def _au_today() -> date:
@@ -81,11 +80,6 @@ def _date_range(
     return [start + timedelta(days=i) for i in range((end - start).days + 1)]
 
 
-def _write_json(path: Path, payload: Dict[str, object]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, sort_keys=True))
-
-
 def _write_index_markdown(out_path: Path, entries: Sequence[Dict[str, object]], config: BackfillConfig) -> None:
     lines: List[str] = []
     lines.append("# TURF digest backfill index")
@@ -120,76 +114,12 @@ def _write_index_markdown(out_path: Path, entries: Sequence[Dict[str, object]],
     out_path.write_text("\n".join(lines).rstrip() + "\n")
 
 
-def _load_demo_artifacts(date_str: str) -> Tuple[dict, dict, dict]:
-    meeting_html = Path("data/demo_meeting.html")
-    odds_html = Path("data/demo_odds.html")
-    meeting_id = f"DEMO_{date_str}"
-    race_number = 1
-
-    parsed = parse_meeting_html(
-        meeting_html.read_text(),
-        meeting_id=meeting_id,
-        race_number=race_number,
-        captured_at=f"{date_str}T10:00:00+11:00",
-    )
-    market = parsed_race_to_market_snapshot(parsed)
-    speed = parsed_race_to_speed_sidecar(parsed)
-
-    odds_rows = parse_generic_odds_table(odds_html.read_text())
-    odds = parsed_odds_to_market(odds_rows, meeting_id, race_number, f"{date_str}T10:01:00+11:00")
-    return market, speed, odds
-
-
-def _join_runner_inputs(market: dict, speed: dict) -> List[RunnerInput]:
-    joined: List[RunnerInput] = []
-    speed_map = {r.get("runner_number"): r for r in speed.get("runners", [])}
-    for runner in market.get("runners", []):
-        sidecar = speed_map.get(runner.get("runner_number"), {})
-        joined.append(
-            RunnerInput(
-                runner_number=runner.get("runner_number"),
-                runner_name=runner.get("runner_name"),
-                barrier=runner.get("barrier"),
-                price_now_dec=(runner.get("odds_minimal") or {}).get("price_now_dec"),
-                map_role_inferred=sidecar.get("map_role_inferred"),
-                avg_speed_mps=sidecar.get("avg_speed_mps"),
-            )
-        )
-    return joined
-
-
-def _build_engine_inputs(market: dict, speed: dict, lite_scores: dict) -> dict:
-    speed_map = {r.get("runner_number"): r for r in speed.get("runners", [])}
-    runners = []
-    for runner in market.get("runners", []):
-        rn = runner.get("runner_number")
-        odds_block = runner.get("odds_minimal") or {}
-        sidecar = speed_map.get(rn, {})
-        runners.append(
-            {
-                "runner_number": rn,
-                "lite_score": lite_scores.get(rn, 0.5),
-                "price_now_dec": odds_block.get("price_now_dec"),
-                "barrier": runner.get("barrier"),
-                "map_role_inferred": sidecar.get("map_role_inferred"),
-                "avg_speed_mps": sidecar.get("avg_speed_mps"),
-            }
-        )
-    return {
-        "distance_m": market.get("race", {}).get("distance_m"),
-        "track_condition_raw": market.get("race", {}).get("track_condition_raw")
-        or market.get("meeting", {}).get("track_condition_raw"),
-        "field_size": len(runners),
-        "runners": runners,
-    }
-
-
 def _generate_demo_stake_cards(date_str: str, out_dir: Path) -> None:
     out_dir.mkdir(parents=True, exist_ok=True)
-    market, speed, odds = _load_demo_artifacts(date_str)
+    market, speed, odds = load_demo_artifacts(date_str)
     merged_market = merge_odds_into_market(market, odds)
 
-    runner_rows = _join_runner_inputs(merged_market, speed)
+    runner_rows, engine_runners, price_map = prepare_runner_tables(merged_market, speed)
     stake_card, runner_outputs = compile_stake_card(
         meeting=merged_market.get("meeting", {}),
         race=merged_market.get("race", {}),
@@ -199,12 +129,8 @@ def _generate_demo_stake_cards(date_str: str, out_dir: Path) -> None:
     )
     lite_scores = {o.runner_number: o.lite_score for o in runner_outputs}
 
-    engine_inputs = _build_engine_inputs(merged_market, speed, lite_scores)
+    engine_inputs = build_engine_inputs(merged_market, engine_runners, lite_scores)
     runner_vector_payload = build_runner_vector(engine_inputs)
-    price_map = {
-        row.get("runner_number"): (row.get("odds_minimal") or {}).get("price_now_dec")
-        for row in merged_market.get("runners", [])
-    }
     forecasts = pro_overlay_logit_win_place_v0(
         runner_vector_payload.get("runners", []),
         price_map,
@@ -224,9 +150,9 @@ def _generate_demo_stake_cards(date_str: str, out_dir: Path) -> None:
         feature_flags=feature_flags,
     )
 
-    (out_dir / "stake_card.json").write_text(json.dumps(stake_card, indent=2))
-    (out_dir / "stake_card_pro.json").write_text(json.dumps(stake_card_pro, indent=2))
-    (out_dir / "runner_vector.json").write_text(json.dumps(runner_vector_payload, indent=2))
+    write_json_atomic(out_dir / "stake_card.json", stake_card)
+    write_json_atomic(out_dir / "stake_card_pro.json", stake_card_pro)
+    write_json_atomic(out_dir / "runner_vector.json", runner_vector_payload)
 
 
 def _copy_stake_cards_for_date(source_root: Path, date_str: str, dest_dir: Path) -> bool:
@@ -240,8 +166,7 @@ def _copy_stake_cards_for_date(source_root: Path, date_str: str, dest_dir: Path)
 
     dest_dir.mkdir(parents=True, exist_ok=True)
     for src in sorted(files, key=lambda p: str(p)):
-        dest = dest_dir / src.name
-        dest.write_text(src.read_text())
+        write_bytes_atomic(dest_dir / src.name, src.read_bytes())
     return True
 
 
@@ -274,6 +199,7 @@ def backfill_digests(config: BackfillConfig) -> Dict[str, object]:
             write_per_meeting=config.write_per_meeting,
             simulate=config.simulate,
             seed=config.seed,
+            workers=config.workers,
         )
 
         public_info: Dict[str, object] = {}
@@ -282,17 +208,18 @@ def backfill_digests(config: BackfillConfig) -> Dict[str, object]:
             daily_html, meeting_htmls = render_digest_pages(derived_dir=derived_dir, public_derived_dir=public_derived_dir)
             if daily_html:
                 public_info["daily_digest_html"] = str(daily_html.relative_to(out_dir))
-            public_info["index_html"] = str((public_derived_dir / "index.html").relative_to(out_dir))
+            public_info["index_html"] = os.path.join(date_str, "public", "derived", "index.html")
             if meeting_htmls:
                 public_info["meeting_digest_html"] = [str(p.relative_to(out_dir)) for p in meeting_htmls]
 
-        meetings_dir = derived_dir / "meetings"
+        # Index paths are relative to out_dir; join them as strings rather than via relative_to().
+        derived_rel = os.path.join(date_str, "derived")
         derived_info: Dict[str, object] = {
-            "daily_digest_json": str((derived_dir / "daily_digest.json").relative_to(out_dir)),
-            "daily_digest_md": str((derived_dir / "daily_digest.md").relative_to(out_dir)),
+            "daily_digest_json": os.path.join(derived_rel, "daily_digest.json"),
+            "daily_digest_md": os.path.join(derived_rel, "daily_digest.md"),
         }
-        if meetings_dir.exists():
-            derived_info["meetings_dir"] = str(meetings_dir.relative_to(out_dir))
+        if os.path.isdir(os.path.join(derived_dir, "meetings")):
+            derived_info["meetings_dir"] = os.path.join(derived_rel, "meetings")
 
         entries.append(
             {
@@ -327,7 +254,7 @@ def backfill_digests(config: BackfillConfig) -> Dict[str, object]:
         "dates": entries,
     }
 
-    _write_json(out_dir / "index.json", index_payload)
+    write_json_atomic(out_dir / "index.json", index_payload, sort_keys=True)
     _write_index_markdown(out_dir / "index.md", entries, config)
 
     return index_payload
@@ -1,21 +1,48 @@
 from __future__ import annotations
 
-import json
+import functools
 import math
+import os
 import pathlib
+import sys
 import uuid
-from typing import List, Optional
 
+from cli._version import print_version_if_requested
+
+# `python -m turf.cli --version` answers before Typer/Rich are imported or any
+# command is registered.
+if __name__ == "__main__" and print_version_if_requested(sys.argv):
+    raise SystemExit(0)
+
+import orjson
 import typer
+from pydantic import TypeAdapter
 from rich import print
 from rich.console import Console
 from rich.table import Table
 
 from .compile_lite import RunnerInput, compile_stake_card, merge_odds_into_market
-from .models import ExecutionRequest, ExecutionScope, ScrapePlan, ScrapePlanScope, TrackRegistry
+from .models import ExecutionRequest, ExecutionScope, ResolvedTrack, ScrapePlan, ScrapePlanScope, TrackRegistry
 from .parse_odds import parse_generic_odds_table, parsed_odds_to_market
 from .parse_ra import parsed_race_to_market_snapshot, parsed_race_to_speed_sidecar, parse_meeting_html
 from .resolver import build_track_resolver_index, resolve_track, resolve_tracks
+from .jsonio import load_json_cached, write_json_atomic
+
+_RESOLVED_LIST_ADAPTER = TypeAdapter(list[ResolvedTrack])
+
+
+@functools.lru_cache(maxsize=16)
+def _load_registry_cached(path: str, mtime_ns: int, size: int) -> TrackRegistry:
+    with open(path, "rb") as f:
+        return TrackRegistry.model_validate(orjson.loads(f.read()))
+
+
+def _load_registry(path: str) -> TrackRegistry:
+    """Load a registry, reusing the parsed model while the file is unchanged (read-only)."""
+
+    st = os.stat(path)
+    return _load_registry_cached(path, st.st_mtime_ns, st.st_size)
+
 
 app = typer.Typer(help="TURF registry + resolver + scrape plan CLI")
 ra_app = typer.Typer(help="Fetch and parse Racing Australia style HTML")
@@ -34,27 +61,25 @@ app.add_typer(matchups_app, name="matchups")
 @app.command()
 def resolve(
     registry: str = typer.Option(..., help="Path to turf.track_registry.v1 JSON"),
-    tracks: List[str] = typer.Option(..., help="Track strings to resolve"),
-    state_hint: Optional[str] = typer.Option(None, help="Optional state hint (e.g., NSW)"),
+    tracks: list[str] = typer.Option(..., help="Track strings to resolve"),
+    state_hint: str | None = typer.Option(None, help="Optional state hint (e.g., NSW)"),
 ):
-    with open(registry, "r") as f:
-        reg = TrackRegistry.model_validate_json(f.read())
+    reg = _load_registry(registry)
     resolved = resolve_tracks(tracks, reg, state_hint=state_hint)
-    print(json.dumps([r.model_dump() for r in resolved], indent=2))
+    typer.echo(_RESOLVED_LIST_ADAPTER.dump_json(resolved, indent=2))
 
 
 @app.command()
 def plan(
     registry: str = typer.Option(..., help="Path to turf.track_registry.v1 JSON"),
     date: str = typer.Option(..., help="YYYY-MM-DD"),
-    states: List[str] = typer.Option(..., help="States, e.g., --states NSW --states VIC"),
-    tracks: List[str] = typer.Option(..., help="Tracks to include in scope"),
+    states: list[str] = typer.Option(..., help="States, e.g., --states NSW --states VIC"),
+    tracks: list[str] = typer.Option(..., help="Tracks to include in scope"),
     created_at_local: str = typer.Option("2025-12-09T11:00:00+11:00", help="Local timestamp for plan"),
     tz: str = typer.Option("Australia/Sydney", help="Timezone string"),
     track_registry_version: str = typer.Option("turf.track_registry.v1@0.1.0", help="Registry version ref"),
 ):
-    with open(registry, "r") as f:
-        reg = TrackRegistry.model_validate_json(f.read())
+    reg = _load_registry(registry)
     req = ExecutionRequest(
         request_id=str(uuid.uuid4()),
         created_at_local=created_at_local,
@@ -89,8 +114,8 @@ def ra_parse(
 
     market = parsed_race_to_market_snapshot(parsed)
     speed = parsed_race_to_speed_sidecar(parsed)
-    out_market.write_text(json.dumps(market, indent=2))
-    out_speed.write_text(json.dumps(speed, indent=2))
+    write_json_atomic(out_market, market)
+    write_json_atomic(out_speed, speed)
     print(f"Wrote market snapshot to {out_market} and speed sidecar to {out_speed}")
 
 
@@ -105,7 +130,7 @@ def odds_parse(
     with open(html, "r") as f:
         rows = parse_generic_odds_table(f.read())
     market = parsed_odds_to_market(rows, meeting_id, race_number, captured_at)
-    out_path.write_text(json.dumps(market, indent=2))
+    write_json_atomic(out_path, market)
     print(f"Wrote parsed odds to {out_path}")
 
 
@@ -115,8 +140,8 @@ def merge_odds(
     odds: pathlib.Path = typer.Option(..., exists=True, help="parsed odds JSON"),
     out_path: pathlib.Path = typer.Option(..., "--out", help="Output merged market snapshot"),
 ):
-    merged = merge_odds_into_market(json.loads(market.read_text()), json.loads(odds.read_text()))
-    out_path.write_text(json.dumps(merged, indent=2))
+    merged = merge_odds_into_market(orjson.loads(market.read_bytes()), orjson.loads(odds.read_bytes()))
+    write_json_atomic(out_path, merged)
     print(f"Merged odds written to {out_path}")
 
 
@@ -127,12 +152,12 @@ def compile_stake_card_cli(
     out_path: pathlib.Path = typer.Option(..., "--out", help="Where to write turf.stake_card.v1 JSON"),
     include_overlay: bool = typer.Option(True, help="Whether to compute overlay forecast outputs"),
 ):
-    market_json = json.loads(market.read_text())
-    speed_json = json.loads(speed.read_text())
+    market_json = orjson.loads(market.read_bytes())
+    speed_json = orjson.loads(speed.read_bytes())
 
     meeting = market_json.get("meeting", {})
     race = market_json.get("race", {})
-    joined: List[RunnerInput] = []
+    joined: list[RunnerInput] = []
     speed_map = {r.get("runner_number"): r for r in speed_json.get("runners", [])}
     for runner in market_json.get("runners", []):
         sidecar = speed_map.get(runner.get("runner_number"), {})
@@ -154,7 +179,7 @@ def compile_stake_card_cli(
         captured_at=market_json.get("provenance", {}).get("captured_at", "UNKNOWN"),
         include_overlay=include_overlay,
     )
-    out_path.write_text(json.dumps(stake_card, indent=2))
+    write_json_atomic(out_path, stake_card)
     print(f"Stake card written to {out_path}")
 
 
@@ -183,9 +208,9 @@ def calculate_ev(probability: float, odds: float) -> float:
 def filter_value(
     stake_card: pathlib.Path = typer.Option(..., "--stake-card", exists=True, help="Path to stake_card JSON"),
     min_ev: float = typer.Option(0.05, "--min-ev", help="Minimum EV threshold (e.g., 0.05 = 5%)"),
-    max_price: Optional[float] = typer.Option(None, "--max-price", help="Maximum price filter (e.g., 10.0)"),
-    min_price: Optional[float] = typer.Option(None, "--min-price", help="Minimum price filter (e.g., 2.0)"),
-    out_path: Optional[pathlib.Path] = typer.Option(None, "--out", help="Output JSON file (optional)"),
+    max_price: float | None = typer.Option(None, "--max-price", help="Maximum price filter (e.g., 10.0)"),
+    min_price: float | None = typer.Option(None, "--min-price", help="Minimum price filter (e.g., 2.0)"),
+    out_path: pathlib.Path | None = typer.Option(None, "--out", help="Output JSON file (optional)"),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Suppress table output"),
 ):
     """Filter runners by expected value and price range.
@@ -194,7 +219,7 @@ def filter_value(
 
     Positive EV indicates a profitable bet in expectation.
     """
-    card = json.loads(stake_card.read_text())
+    card = load_json_cached(stake_card)
     races = card.get("races", [])
     meeting = card.get("meeting", {})
 
@@ -281,7 +306,7 @@ def filter_value(
             "count": len(value_bets),
             "bets": value_bets,
         }
-        out_path.write_text(json.dumps(output, indent=2))
+        write_json_atomic(out_path, output)
         print(f"Value bets written to {out_path}")
 
     return value_bets
@@ -327,8 +352,8 @@ def calculate_pairwise_probability(prob_i: float, prob_j: float) -> float:
 @matchups_app.command("generate")
 def matchups_generate(
     stake_card: pathlib.Path = typer.Option(..., "--stake-card", exists=True, help="Path to stake_card JSON"),
-    race_number: Optional[int] = typer.Option(None, "--race", help="Specific race number (default: all)"),
-    out_path: Optional[pathlib.Path] = typer.Option(None, "--out", help="Output JSON file"),
+    race_number: int | None = typer.Option(None, "--race", help="Specific race number (default: all)"),
+    out_path: pathlib.Path | None = typer.Option(None, "--out", help="Output JSON file"),
     top_n: int = typer.Option(5, "--top", help="Only show top N runners by win prob"),
     quiet: bool = typer.Option(False, "--quiet", "-q", help="Suppress table output"),
 ):
@@ -338,7 +363,7 @@ def matchups_generate(
 
     This derived output does NOT modify Lite ordering/math.
     """
-    card = json.loads(stake_card.read_text())
+    card = load_json_cached(stake_card)
     races = card.get("races", [])
     meeting = card.get("meeting", {})
 
@@ -431,7 +456,7 @@ def matchups_generate(
             "matchup_count": len(all_matchups),
             "matchups": all_matchups,
         }
-        out_path.write_text(json.dumps(output, indent=2))
+        write_json_atomic(out_path, output)
         print(f"Matchups written to {out_path}")
 
     if not quiet:
@@ -440,5 +465,13 @@ def matchups_generate(
     return all_matchups
 
 
-if __name__ == "__main__":
+def main() -> None:
+    """Console entry point: answer --version without building the Click command tree."""
+
+    if print_version_if_requested(sys.argv):
+        return
     app()
+
+
+if __name__ == "__main__":
+    main()
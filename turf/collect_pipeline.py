@@ -19,14 +19,13 @@ The pipeline is designed for determinism:
 """
 
 import copy
-import json
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from zoneinfo import ZoneInfo
 
-from turf.compile_lite import RunnerInput, compile_stake_card, merge_odds_into_market
+from turf.compile_lite import compile_stake_card, merge_odds_into_market
 from turf.odds_collect import (
     OddsAdapter,
     OddsSnapshot,
@@ -40,6 +39,8 @@ from turf.ra_collect import (
     discover_captured_meetings,
     load_captured_meeting,
 )
+from turf.runner_join import build_engine_inputs, prepare_runner_tables
+from turf.jsonio import write_json_atomic
 
 SYDNEY_TZ = ZoneInfo("Australia/Sydney")
 
@@ -97,44 +98,20 @@ def _today_local(tz: ZoneInfo = SYDNEY_TZ) -> str:
     return datetime.now(tz).date().isoformat()
 
 
-def _write_json(path: Path, data: dict) -> None:
-    """Write JSON with consistent formatting."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2))
-
-
 def _deep_copy(data: dict) -> dict:
     """Deep copy a dict to avoid mutation."""
     return copy.deepcopy(data)
 
 
-def _join_runner_inputs(market: dict, sidecar: dict) -> List[RunnerInput]:
-    """Join market snapshot and speed sidecar into RunnerInput list."""
-    speed_map = {r.get("runner_number"): r for r in sidecar.get("runners", [])}
-    joined = []
-    for runner in market.get("runners", []):
-        rn = runner.get("runner_number")
-        sidecar_data = speed_map.get(rn, {})
-        joined.append(
-            RunnerInput(
-                runner_number=rn,
-                runner_name=runner.get("runner_name", f"Runner {rn}"),
-                barrier=runner.get("barrier"),
-                price_now_dec=(runner.get("odds_minimal") or {}).get("price_now_dec"),
-                map_role_inferred=sidecar_data.get("map_role_inferred"),
-                avg_speed_mps=sidecar_data.get("avg_speed_mps"),
-            )
-        )
-    return joined
-
-
 def _stake_card_filename(meeting_id: str, race_number: int, pro: bool = False) -> str:
     """Generate deterministic stake card filename."""
     suffix = "_pro" if pro else ""
     return f"stake_card_r{race_number}{suffix}.json"
 
 
-def _try_apply_pro_overlay(stake_card: dict, market: dict, sidecar: dict) -> Optional[dict]:
+def _try_apply_pro_overlay(
+    stake_card: dict, market: dict, engine_runners: List[dict], prices: Dict[Any, Any]
+) -> Optional[dict]:
     """Try to apply PRO overlay if engine module is available."""
     try:
         from engine.turf_engine_pro import (
@@ -150,39 +127,8 @@ def _try_apply_pro_overlay(stake_card: dict, market: dict, sidecar: dict) -> Opt
         for runner in race.get("runners", []):
             lite_scores[runner.get("runner_number")] = runner.get("lite_score", 0.5)
 
-        # Build engine inputs
-        speed_map = {r.get("runner_number"): r for r in sidecar.get("runners", [])}
-        runners = []
-        for runner in market.get("runners", []):
-            rn = runner.get("runner_number")
-            odds_block = runner.get("odds_minimal") or {}
-            sidecar_data = speed_map.get(rn, {})
-            runners.append(
-                {
-                    "runner_number": rn,
-                    "lite_score": lite_scores.get(rn, 0.5),
-                    "price_now_dec": odds_block.get("price_now_dec"),
-                    "barrier": runner.get("barrier"),
-                    "map_role_inferred": sidecar_data.get("map_role_inferred"),
-                    "avg_speed_mps": sidecar_data.get("avg_speed_mps"),
-                }
-            )
-
-        engine_inputs = {
-            "distance_m": market.get("race", {}).get("distance_m"),
-            "track_condition_raw": market.get("race", {}).get("track_condition_raw")
-            or market.get("meeting", {}).get("track_condition_raw"),
-            "field_size": len(runners),
-            "runners": runners,
-        }
-
-        runner_vector = build_runner_vector(engine_inputs)
-
-        # Get prices for overlay
-        prices = {}
-        for runner in market.get("runners", []):
-            odds_block = runner.get("odds_minimal") or {}
-            prices[runner.get("runner_number")] = odds_block.get("price_now_dec")
+        # Engine runners/prices come from the same join pass as the Lite rows.
+        runner_vector = build_runner_vector(build_engine_inputs(market, engine_runners, lite_scores))
 
         forecasts = pro_overlay_logit_win_place_v0(
             runner_vector.get("runners", []),
@@ -239,7 +185,7 @@ def process_race(
         merged_market = merge_odds_into_market(merged_market, odds_merge_format)
 
     # Build runner inputs
-    runner_rows = _join_runner_inputs(merged_market, sidecar)
+    runner_rows, engine_runners, prices = prepare_runner_tables(merged_market, sidecar, default_name="Runner {}")
 
     # Compile Lite stake card
     stake_card, _ = compile_stake_card(
@@ -253,7 +199,7 @@ def process_race(
     # Try to apply PRO overlay
     stake_card_pro = None
     if apply_pro:
-        stake_card_pro = _try_apply_pro_overlay(stake_card, merged_market, sidecar)
+        stake_card_pro = _try_apply_pro_overlay(stake_card, merged_market, engine_runners, prices)
 
     return RaceArtifacts(
         meeting_id=race_capture.meeting_id,
@@ -319,7 +265,7 @@ def write_meeting_stake_cards(
         lite_path = meeting_out / _stake_card_filename(
             meeting.meeting_id, race.race_number, pro=False
         )
-        _write_json(lite_path, race.stake_card)
+        write_json_atomic(lite_path, race.stake_card)
         written.append(lite_path)
 
         # Write PRO stake card if available
@@ -327,7 +273,7 @@ def write_meeting_stake_cards(
             pro_path = meeting_out / _stake_card_filename(
                 meeting.meeting_id, race.race_number, pro=True
             )
-            _write_json(pro_path, race.stake_card_pro)
+            write_json_atomic(pro_path, race.stake_card_pro)
             written.append(pro_path)
 
     return written
@@ -9,7 +9,7 @@ from typing import Dict, Iterable, List, Tuple
 NEUTRAL = 0.50
 
 
-@dataclass
+@dataclass(slots=True)
 class RunnerInput:
     runner_number: int
     runner_name: str
@@ -15,13 +15,16 @@ Hard constraints:
   - do not mutate input payloads (read-only)
 """
 
-import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 from turf.digest import build_strategy_digest
-from turf.simulation import select_bets_from_stake_card, simulate_bankroll, write_json
+from turf.jsonio import load_json_cached, write_json
+from turf.simulation import select_bets_from_stake_card, simulate_bankroll
 
 
 def _meeting_key(payload: Dict[str, Any]) -> Tuple[str, str]:
@@ -31,18 +34,18 @@ def _meeting_key(payload: Dict[str, Any]) -> Tuple[str, str]:
     return str(date_local), str(meeting_id)
 
 
-def _load_json(path: Path) -> Dict[str, Any]:
-    # Read-only; do not mutate.
-    return json.loads(path.read_text())
-
-
 def discover_stake_cards(dir_path: Path) -> List[Path]:
     """Deterministically discover candidate stake-card JSON files in a directory."""
-    if not dir_path.exists() or not dir_path.is_dir():
+    if not dir_path.is_dir():
         return []
-    files = [p for p in dir_path.glob("*.json") if p.is_file()]
-    files_sorted = sorted(files, key=lambda p: str(p))
-    return [p for p in files_sorted if "stake_card" in p.name]
+    # One scandir pass: match on names (no Path per entry) and use the cached d_type for is_file.
+    with os.scandir(dir_path) as entries:
+        names = sorted(
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".json") and "stake_card" in entry.name and entry.is_file()
+        )
+    return [dir_path / name for name in names]
 
 
 def _is_pro_path(p: Path) -> bool:
@@ -57,7 +60,7 @@ def dedupe_by_meeting(paths: List[Path], *, prefer_pro: bool) -> List[Path]:
     """
     chosen: Dict[Tuple[str, str], Path] = {}
     for p in paths:
-        payload = _load_json(p)
+        payload = load_json_cached(p)
         key = _meeting_key(payload)
         prev = chosen.get(key)
         if prev is None:
@@ -157,6 +160,60 @@ def render_daily_digest_markdown(daily: Dict[str, Any]) -> str:
     return "\n".join(lines).rstrip() + "\n"
 
 
+def _digest_meeting(
+    path: Path,
+    *,
+    out_dir: Path,
+    write_per_meeting: bool,
+    selection_rules: Dict[str, Any],
+    bankroll_policy: Dict[str, Any],
+    simulate: bool,
+    iters: int,
+    seed: int,
+) -> Dict[str, Any]:
+    """Digest a single stake card (top-level so it can run in a worker process)."""
+    payload = load_json_cached(path)
+    date_local, meeting_id = _meeting_key(payload)
+
+    bets = select_bets_from_stake_card(payload, **selection_rules)
+
+    sim_summary = None
+    if simulate:
+        sim_summary = simulate_bankroll(bets=bets, iters=iters, seed=seed, **bankroll_policy)
+
+    digest_payload = build_strategy_digest(
+        stake_card=payload,
+        bets=bets,
+        selection_rules=dict(selection_rules),
+        bankroll_policy=dict(bankroll_policy),
+        simulation_summary=sim_summary,
+    )
+
+    meeting_record: Dict[str, Any] = {
+        "meeting_id": meeting_id,
+        "date_local": date_local,
+        "source_path": str(path),
+        "bets_count": len(bets),
+        "strategy_digest": digest_payload,
+    }
+
+    if write_per_meeting:
+        meeting_slug = _slugify(meeting_id)
+        meeting_folder = f"{date_local}_{meeting_slug}"
+        meeting_out_dir = out_dir / "meetings" / meeting_folder
+        meeting_out_dir.mkdir(parents=True, exist_ok=True)
+
+        # Deterministic outputs (stable JSON + stable Markdown).
+        write_json(meeting_out_dir / "strategy_digest.json", digest_payload)
+        (meeting_out_dir / "strategy_digest.md").write_text(_render_meeting_digest_markdown(digest_payload))
+
+        # Store paths relative to out_dir for portability/determinism.
+        meeting_record["digest_json_path"] = os.path.join("meetings", meeting_folder, "strategy_digest.json")
+        meeting_record["digest_md_path"] = os.path.join("meetings", meeting_folder, "strategy_digest.md")
+
+    return meeting_record
+
+
 def build_daily_digest(
     *,
     stake_cards_dir: Path,
@@ -174,78 +231,43 @@ def build_daily_digest(
     simulate: bool = False,
     iters: int = 10_000,
     seed: int = 1337,
+    workers: int = 1,
 ) -> Dict[str, Any]:
-    """Build and write daily_digest.json + daily_digest.md deterministically."""
+    """Build and write daily_digest.json + daily_digest.md deterministically.
+
+    ``workers > 1`` digests meetings in a process pool; output is identical to the serial run.
+    """
     files = discover_stake_cards(stake_cards_dir)
     selected = dedupe_by_meeting(files, prefer_pro=prefer_pro)
 
-    meetings_out: List[Dict[str, Any]] = []
-
-    for p in selected:
-        payload = _load_json(p)
-        date_local, meeting_id = _meeting_key(payload)
-
-        bets = select_bets_from_stake_card(
-            payload,
-            require_positive_ev=require_positive_ev,
-            min_ev=min_ev,
-            min_edge=min_edge,
-        )
-
-        sim_summary = None
-        if simulate:
-            sim_summary = simulate_bankroll(
-                bets=bets,
-                iters=iters,
-                seed=seed,
-                bankroll_start=bankroll_start,
-                policy=policy,
-                flat_stake=flat_stake,
-                kelly_fraction=kelly_fraction,
-                max_stake_frac=max_stake_frac,
-            )
-
-        digest_payload = build_strategy_digest(
-            stake_card=payload,
-            bets=bets,
-            selection_rules={
-                "require_positive_ev": require_positive_ev,
-                "min_ev": min_ev,
-                "min_edge": min_edge,
-            },
-            bankroll_policy={
-                "policy": policy,
-                "bankroll_start": bankroll_start,
-                "flat_stake": flat_stake,
-                "kelly_fraction": kelly_fraction,
-                "max_stake_frac": max_stake_frac,
-            },
-            simulation_summary=sim_summary,
-        )
+    digest_one = partial(
+        _digest_meeting,
+        out_dir=out_dir,
+        write_per_meeting=write_per_meeting,
+        selection_rules={
+            "require_positive_ev": require_positive_ev,
+            "min_ev": min_ev,
+            "min_edge": min_edge,
+        },
+        bankroll_policy={
+            "policy": policy,
+            "bankroll_start": bankroll_start,
+            "flat_stake": flat_stake,
+            "kelly_fraction": kelly_fraction,
+            "max_stake_frac": max_stake_frac,
+        },
+        simulate=simulate,
+        iters=iters,
+        seed=seed,
+    )
 
-        meeting_record: Dict[str, Any] = {
-            "meeting_id": meeting_id,
-            "date_local": date_local,
-            "source_path": str(p),
-            "bets_count": len(bets),
-            "strategy_digest": digest_payload,
-        }
-
-        if write_per_meeting:
-            meeting_slug = _slugify(meeting_id)
-            meeting_folder = f"{date_local}_{meeting_slug}"
-            meeting_out_dir = out_dir / "meetings" / meeting_folder
-            meeting_out_dir.mkdir(parents=True, exist_ok=True)
-
-            # Deterministic outputs (stable JSON + stable Markdown).
-            write_json(meeting_out_dir / "strategy_digest.json", digest_payload)
-            (meeting_out_dir / "strategy_digest.md").write_text(_render_meeting_digest_markdown(digest_payload))
-
-            # Store paths relative to out_dir for portability/determinism.
-            meeting_record["digest_json_path"] = str(Path("meetings") / meeting_folder / "strategy_digest.json")
-            meeting_record["digest_md_path"] = str(Path("meetings") / meeting_folder / "strategy_digest.md")
-
-        meetings_out.append(meeting_record)
+    # Meetings are independent; results are re-sorted below, so a pool cannot change output.
+    if workers > 1 and len(selected) > 1:
+        workers = min(workers, len(selected))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            meetings_out = list(pool.map(digest_one, selected, chunksize=max(1, len(selected) // (4 * workers))))
+    else:
+        meetings_out = [digest_one(p) for p in selected]
 
     meetings_out = sorted(
         meetings_out,
@@ -0,0 +1,59 @@
+"""Shared demo-fixture loading for `demo-run` and `backfill-digests`.
+
+Both entry points compile the same fixture race; keeping the loader in one place keeps
+their stake cards in lockstep. Runner joins live in `turf.runner_join`.
+"""
+
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from typing import List, Tuple
+
+from turf.parse_odds import ParsedOddsRow, parse_generic_odds_table, parsed_odds_to_market
+from turf.parse_ra import (
+    ParsedRace,
+    parse_meeting_html,
+    parsed_race_to_market_snapshot,
+    parsed_race_to_speed_sidecar,
+)
+
+DEMO_MEETING_HTML = "data/demo_meeting.html"
+DEMO_ODDS_HTML = "data/demo_odds.html"
+
+
+def _read_fixture(path: str) -> str:
+    """Fixture HTML as UTF-8 text (locale-independent)."""
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8")
+
+
+@lru_cache(maxsize=8)
+def _parse_meeting_fixture(path: str, mtime_ns: int, date: str) -> ParsedRace:
+    return parse_meeting_html(
+        _read_fixture(path),
+        meeting_id=f"DEMO_{date}",
+        race_number=1,
+        captured_at=f"{date}T10:00:00+11:00",
+    )
+
+
+@lru_cache(maxsize=8)
+def _parse_odds_fixture(path: str, mtime_ns: int) -> List[ParsedOddsRow]:
+    return parse_generic_odds_table(_read_fixture(path))
+
+
+def load_demo_artifacts(date: str) -> Tuple[dict, dict, dict]:
+    """Market, speed sidecar and odds dicts for the demo fixtures.
+
+    The HTML parse is cached per ``(path, st_mtime_ns[, date])``; the dicts are rebuilt on
+    every call, so callers may mutate them (``merge_odds_into_market`` does).
+    """
+
+    parsed = _parse_meeting_fixture(DEMO_MEETING_HTML, os.stat(DEMO_MEETING_HTML).st_mtime_ns, date)
+    market = parsed_race_to_market_snapshot(parsed)
+    speed = parsed_race_to_speed_sidecar(parsed)
+
+    odds_rows = _parse_odds_fixture(DEMO_ODDS_HTML, os.stat(DEMO_ODDS_HTML).st_mtime_ns)
+    odds = parsed_odds_to_market(odds_rows, f"DEMO_{date}", 1, f"{date}T10:01:00+11:00")
+    return market, speed, odds
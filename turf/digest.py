@@ -10,7 +10,8 @@ from __future__ import annotations
 from dataclasses import asdict
 from typing import Any, Dict, List, Optional, Tuple
 
-from turf.simulation import Bet, stake_for_bet, write_json
+from turf.jsonio import write_json
+from turf.simulation import Bet, stake_for_bet
 
 
 def _stable_bet_sort_key(b: Bet) -> Tuple[Any, Any]:
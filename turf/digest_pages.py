@@ -13,6 +13,7 @@ Determinism rules:
 
 import argparse
 import html
+import os
 from pathlib import Path
 from typing import List, Tuple
 
@@ -52,8 +53,16 @@ def _discover_meeting_markdowns(derived_dir: Path) -> List[Path]:
     meetings_dir = derived_dir / "meetings"
     if not meetings_dir.exists() or not meetings_dir.is_dir():
         return []
-    md_paths = [p for p in meetings_dir.rglob("*.md") if p.is_file()]
-    return sorted(md_paths, key=lambda p: str(p))
+    # os.walk yields plain strings and already separates files from directories, so the
+    # sort compares str paths (same order as sorting Paths by str) and Path is built last.
+    md_paths = [
+        os.path.join(dirpath, name)
+        for dirpath, _dirnames, filenames in os.walk(meetings_dir)
+        for name in filenames
+        if name.endswith(".md")
+    ]
+    md_paths.sort()
+    return [Path(p) for p in md_paths]
 
 
 def render_digest_pages(*, derived_dir: Path, public_derived_dir: Path) -> Tuple[Path | None, List[Path]]:
@@ -0,0 +1,62 @@
+"""JSON file I/O shared by the CLIs and pipelines: cached reads and atomic writes."""
+
+from __future__ import annotations
+
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse with orjson, falling back to stdlib ``json`` for the ``NaN``/``Infinity`` tokens it writes."""
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+@lru_cache(maxsize=256)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    with open(path, "rb") as f:
+        return loads_json(f.read())
+
+
+def load_json_cached(path: Path) -> Any:
+    """Load a JSON file, reusing the parsed value while its mtime and size are unchanged.
+
+    The returned object is shared between callers; treat it as read-only.
+    """
+    st = os.stat(path)
+    return _load_json_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write via a temp file + ``os.replace``: readers see the old file or the new one, never a partial write."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def write_json_atomic(path: Path, payload: Any, *, indent: Optional[int] = 2, sort_keys: bool = False) -> None:
+    """Serialize ``payload`` with stdlib ``json`` and write it atomically.
+
+    Stdlib encoding keeps written cards byte-stable (``\\uXXXX`` escapes, ``repr`` floats,
+    ``NaN``), unlike orjson; ``indent=None`` writes the compact ``,``/``:`` form.
+    """
+    separators = None if indent is not None else (",", ":")
+    text = json.dumps(payload, indent=indent, sort_keys=sort_keys, separators=separators)
+    write_bytes_atomic(path, text.encode("ascii"))
+
+
+def write_json(path: Path, payload: Dict[str, Any]) -> None:
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":")) + "\n"
+    write_bytes_atomic(path, text.encode("ascii"))
@@ -21,7 +21,6 @@ data/raw/<source>/<date>/<meeting_id>/race_<n>.json
 """
 
 import hashlib
-import json
 import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -30,6 +29,10 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
+import orjson
+
+from turf.jsonio import write_json_atomic
+
 SYDNEY_TZ = ZoneInfo("Australia/Sydney")
 
 
@@ -188,7 +191,7 @@ class FixtureAdapter(OddsAdapter):
     def _load_fixture(
         self, path: Path, meeting_id: str, race_number: int, date_local: str
     ) -> OddsSnapshot:
-        data = json.loads(path.read_text())
+        data = orjson.loads(path.read_bytes())
 
         # Support both raw runner list and wrapped format
         if "runners" in data:
@@ -402,7 +405,7 @@ def capture_odds_snapshot(
         "runners": snapshot.runners,
         "captured_at": snapshot.captured_at,
     }
-    json_path.write_text(json.dumps(payload, indent=2))
+    write_json_atomic(json_path, payload)
     return json_path
 
 
@@ -420,7 +423,7 @@ def load_captured_odds(
     if not json_path.exists():
         return None
 
-    data = json.loads(json_path.read_text())
+    data = orjson.loads(json_path.read_bytes())
     return OddsSnapshot(
         meeting_id=data["meeting_id"],
         race_number=data["race_number"],
@@ -0,0 +1,72 @@
+"""Market + speed-sidecar runner joins shared by `demo-run`, `backfill-digests` and `collect`.
+
+One pass over the market runners yields the Lite rows, the PRO engine runner dicts and the
+price map, so every pipeline builds Lite and PRO cards from the same join.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from turf.compile_lite import RunnerInput
+from turf.value import EMPTY_BLOCK
+
+
+def prepare_runner_tables(
+    market: dict, speed: dict, *, default_name: Optional[str] = None
+) -> Tuple[List[RunnerInput], List[dict], Dict]:
+    """Join market runners with the speed sidecar in a single pass.
+
+    Returns the Lite runner rows, the engine runner dicts (``lite_score`` defaults to 0.5
+    until the Lite scores are known) and the ``runner_number -> price_now_dec`` map.
+    ``default_name`` (e.g. ``"Runner {}"``, formatted with the runner number) names runners
+    without a ``runner_name`` key; by default their name is ``None``.
+    """
+
+    speed_map = {r.get("runner_number"): r for r in speed.get("runners", [])}
+    runner_rows: List[RunnerInput] = []
+    engine_runners: List[dict] = []
+    price_map: Dict = {}
+    for runner in market.get("runners", []):
+        rn = runner.get("runner_number")
+        price = (runner.get("odds_minimal") or EMPTY_BLOCK).get("price_now_dec")
+        sidecar = speed_map.get(rn, EMPTY_BLOCK)
+        barrier = runner.get("barrier")
+        map_role = sidecar.get("map_role_inferred")
+        avg_speed = sidecar.get("avg_speed_mps")
+        runner_rows.append(
+            RunnerInput(
+                runner_number=rn,
+                runner_name=runner.get("runner_name", None if default_name is None else default_name.format(rn)),
+                barrier=barrier,
+                price_now_dec=price,
+                map_role_inferred=map_role,
+                avg_speed_mps=avg_speed,
+            )
+        )
+        engine_runners.append(
+            {
+                "runner_number": rn,
+                "lite_score": 0.5,
+                "price_now_dec": price,
+                "barrier": barrier,
+                "map_role_inferred": map_role,
+                "avg_speed_mps": avg_speed,
+            }
+        )
+        price_map[rn] = price
+    return runner_rows, engine_runners, price_map
+
+
+def build_engine_inputs(market: dict, engine_runners: List[dict], lite_scores: Dict) -> dict:
+    """Fill Lite scores into the engine runner dicts and wrap them as engine inputs."""
+
+    for row in engine_runners:
+        row["lite_score"] = lite_scores.get(row["runner_number"], 0.5)
+    race = market.get("race", {})
+    return {
+        "distance_m": race.get("distance_m"),
+        "track_condition_raw": race.get("track_condition_raw") or market.get("meeting", {}).get("track_condition_raw"),
+        "field_size": len(engine_runners),
+        "runners": engine_runners,
+    }
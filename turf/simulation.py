@@ -7,7 +7,7 @@ to keep results stable for the same inputs and seed.
 
 from __future__ import annotations
 
-import json
+import hashlib
 import random
 import statistics
 from dataclasses import dataclass
@@ -15,6 +15,8 @@ from hashlib import sha256
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from turf.jsonio import write_json  # noqa: F401  (re-export for existing importers)
+
 
 def _round_currency(value: float) -> float:
     """Round monetary values deterministically to 2 decimal places."""
@@ -23,13 +25,13 @@ def _round_currency(value: float) -> float:
 
 
 def sha256_file(path: Path) -> str:
-    data = path.read_bytes()
-    return sha256(data).hexdigest()
-
-
-def write_json(path: Path, payload: Dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, sort_keys=True, separators=(",", ":")) + "\n")
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # 3.11+: C-level read loop, GIL released
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
 
 
 @dataclass(frozen=True)
@@ -159,32 +161,54 @@ def simulate_bankroll(
     Bets without price/prob data are skipped (no stake placed).
     """
 
-    rng = random.Random(seed)
+    rng_random = random.Random(seed).random
     finals: List[float] = []
     bets_considered = len(bets)
     bets_simulated = 0
     skipped_missing = 0
 
+    # stake_for_bet, unrolled: everything that does not depend on the running bankroll is
+    # resolved once per bet, so the inner loop only applies the cap and rounding. Bets
+    # without price/prob never stake, so they are counted as skipped without iterating.
+    is_flat = policy == "flat"
+    fractional = policy == "fractional_kelly"
+    playable: List[tuple[float, float, float]] = []
+    for bet in bets:
+        if not bet.has_price_prob:
+            continue
+        win_prob = float(bet.win_prob)  # type: ignore[arg-type]
+        odds_dec = bet.odds_dec
+        kelly_full = 0.0
+        if not is_flat:
+            if policy not in {"kelly", "fractional_kelly"} or odds_dec <= 1:  # type: ignore[operator]
+                continue
+            b = odds_dec - 1.0  # type: ignore[operator]
+            kelly_full = max(0.0, (win_prob * b - (1 - win_prob)) / b)
+        playable.append((win_prob, odds_dec or 0.0, kelly_full))
+    never_staked = bets_considered - len(playable)
+
     for _ in range(iters):
         bankroll = float(bankroll_start)
-        for bet in bets:
-            stake = stake_for_bet(
-                policy=policy,
-                bankroll=bankroll,
-                win_prob=bet.win_prob,
-                odds_dec=bet.odds_dec,
-                flat_stake=flat_stake,
-                kelly_fraction=kelly_fraction,
-                max_stake_frac=max_stake_frac,
-            )
-            if stake <= 0 or not bet.has_price_prob:
+        for win_prob, odds_dec, kelly_full in playable:
+            if bankroll <= 0:
+                skipped_missing += 1
+                continue
+            if is_flat:
+                stake = flat_stake
+            else:
+                stake = bankroll * kelly_full
+                if fractional:
+                    stake *= kelly_fraction
+            stake = round(max(0.0, min(bankroll * max_stake_frac, stake)), 2)
+            if stake <= 0:
                 skipped_missing += 1
                 continue
             bets_simulated += 1
             bankroll -= stake
-            if rng.random() < bet.win_prob:  # type: ignore[arg-type]
-                bankroll += stake * (bet.odds_dec or 0.0)
+            if rng_random() < win_prob:
+                bankroll += stake * odds_dec
         finals.append(_round_currency(bankroll))
+    skipped_missing += never_staked * iters
 
     finals_sorted = sorted(finals)
 
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from typing import Dict, Optional
 
+# `block.get(...) or EMPTY_BLOCK` fallback for missing card sub-blocks; shared, so read-only.
+EMPTY_BLOCK: dict = {}
+
 
 def ev_band(ev: Optional[float]) -> Optional[str]:
     if ev is None: